@@ -0,0 +1,19 @@
+import tgraphics
+
+tgraphics.init_with_backend('pygame')
+
+window = tgraphics.Window.create()
+
+def make_row(index, element):
+    # rows are cheap to rebuild here, a recycled `element` could be updated in place instead
+    return tgraphics.text.Label(f"row {index}", 16, color=(0, 0, 0, 255))
+
+grid = tgraphics.Grid(window.size)
+grid.add_child_top(tgraphics.shapes.Rectangle(window.size, (255, 255, 255, 255)), (0, 0))
+grid.add_child_top(tgraphics.VirtualList(window.size, 100000, 24, make_row), (0, 0))
+
+window.target_element = grid
+
+tgraphics.run()
+
+tgraphics.uninit()
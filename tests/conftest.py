@@ -0,0 +1,47 @@
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pytest
+
+import tgraphics
+from tgraphics.core.backend_loader import _current_backend
+from tgraphics.core.elementABC import ElementABC
+
+@pytest.fixture(scope='session')
+def window():
+    tgraphics.init_with_backend('pygame')
+    return tgraphics.Window.create(size=(200, 200))
+
+@pytest.fixture
+def renderer(window):
+    return window._window.renderer
+
+
+class Swatch(ElementABC):
+    """
+    element filling its area with a mutable color, counting textures taken of it
+    """
+    def __init__(self, size, color):
+        super().__init__()
+        self._sz = size
+        self.color = color
+        self.textures = 0
+
+    @property
+    def size(self):
+        return self._sz
+
+    def render(self, location, size=None):
+        _current_backend().current_renderer().fill_rect((*location, *(size if size else self._sz)), self.color)
+
+    def texture(self, size=None):
+        self.textures += 1
+        return super().texture(size)
+
+@pytest.fixture
+def swatch(window):
+    """
+    factory of `Swatch(size, color)` elements
+    """
+    return Swatch
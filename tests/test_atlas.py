@@ -0,0 +1,62 @@
+import gc
+import itertools
+
+import pygame
+
+from tgraphics.backend.pygame import Surface, TextureAtlas
+
+
+def _surface(color, size=(20, 20)):
+    surface = pygame.Surface(size, pygame.SRCALPHA, 32)
+    surface.fill(color)
+    return Surface(surface)
+
+
+def _color_of(renderer, texture):
+    renderer.clear()
+    texture.draw((0, 0))
+    renderer.flush()
+    surface = renderer._renderer.to_surface()
+    w, h = texture.size
+    return {tuple(surface.get_at((x, y)))[:3] for x in range(w) for y in range(h)}
+
+
+def _overlaps(a, b):
+    return a[0] < b[0] + b[2] and b[0] < a[0] + a[2] and a[1] < b[1] + b[3] and b[1] < a[1] + a[3]
+
+
+def test_repack_keeps_live_regions(renderer):
+    atlas = TextureAtlas(renderer, page_size=64)
+    colors = [(i * 9, 255 - i * 9, 100) for i in range(27)]
+    handles = [atlas.texture_from_surface(_surface(color)) for color in colors]
+    assert len(atlas._pages) == 3
+    # keep every third region alive, spread over all pages
+    live = [(color, handle) for i, (color, handle) in enumerate(zip(colors, handles)) if i % 3 == 0]
+    del handles
+    gc.collect()
+
+    atlas.repack()
+    assert len(atlas._pages) == 1
+    for color, handle in live:
+        assert _color_of(renderer, handle) == {color}
+    for (_, a), (_, b) in itertools.combinations(live, 2):
+        assert not (a._texture is b._texture and _overlaps(a._rect, b._rect))
+
+
+def test_placed_region_padding_is_cleared(renderer):
+    atlas = TextureAtlas(renderer, page_size=64)
+    large = atlas.texture_from_surface(_surface((255, 0, 0), (40, 40)))
+    page = large._texture
+    del large
+    gc.collect()
+
+    small = atlas.texture_from_surface(_surface((0, 0, 255), (10, 10)))
+    assert small._texture is page and small._rect == (0, 0, 10, 10)
+    renderer.clear()
+    page.draw(dstrect=(0, 0, 64, 64))
+    renderer.flush()
+    surface = renderer._renderer.to_surface()
+    assert tuple(surface.get_at((5, 5)))[:3] == (0, 0, 255)
+    # padding around the region
+    assert tuple(surface.get_at((10, 5)))[:3] == (0, 0, 0)
+    assert tuple(surface.get_at((5, 10)))[:3] == (0, 0, 0)
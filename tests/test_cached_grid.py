@@ -0,0 +1,38 @@
+import pytest
+
+import tgraphics
+
+
+def _draw(renderer, element):
+    renderer.clear()
+    element.render((0, 0))
+    renderer.flush()
+    return renderer._renderer.to_surface()
+
+
+@pytest.mark.parametrize('grid_factory', [
+    lambda: tgraphics.CachedGrid((200, 200)),
+    lambda: tgraphics.ScrollView((200, 200), tile_size=64),
+], ids=['CachedGrid', 'ScrollView'])
+def test_moved_child_is_redrawn(renderer, swatch, grid_factory):
+    grid = grid_factory()
+    sub = grid.add_child_top(swatch((20, 20), (255, 0, 0, 255)), (0, 0))
+    assert tuple(_draw(renderer, grid).get_at((10, 10)))[:3] == (255, 0, 0)
+    sub.offset = (100, 100)
+    surface = _draw(renderer, grid)
+    assert tuple(surface.get_at((10, 10)))[:3] == (0, 0, 0)
+    assert tuple(surface.get_at((110, 110)))[:3] == (255, 0, 0)
+
+
+def test_moved_child_damages_old_and_new_region(window, swatch):
+    grid = tgraphics.Grid((200, 200))
+    sub = grid.add_child_top(swatch((20, 20), (255, 0, 0, 255)), (10, 10))
+    window.render_mode = 'partial'
+    window.target_element = grid
+    try:
+        window._window._invalidated = False
+        sub.offset = (100, 100)
+        assert window._window._damage == (10, 10, 120, 120)
+    finally:
+        window.target_element = None
+        window.render_mode = 'per_frame'
@@ -0,0 +1,88 @@
+import asyncio
+
+from tgraphics.core.eventdispatch import EventDispatcher, event_handler
+
+class Base(EventDispatcher):
+    def __init__(self, calls):
+        super().__init__()
+        self.calls = calls
+
+    @event_handler
+    def on_a(self, v):
+        self.calls.append(('base', v))
+        return 'base'
+
+
+class Derived(Base):
+    @event_handler
+    def on_a(self, v):
+        self.calls.append(('derived', v))
+        return super().dispatch('on_a', v)
+
+    @event_handler
+    async def on_b(self, v):
+        self.calls.append(('derived async', v))
+        return await super().dispatch_async('on_b', v)
+
+
+class Target(EventDispatcher):
+    def __init__(self, calls):
+        super().__init__()
+        self.calls = calls
+
+    @event_handler
+    def on_b(self, v):
+        self.calls.append(('target', v))
+        return 'target'
+
+
+def test_listeners_run_in_order_before_handler():
+    calls = []
+    obj = Base(calls)
+    obj.event['on_a'].add_listener(lambda v: calls.append(('first', v)))
+    obj.event['on_a'].add_listener(lambda v: calls.append(('second', v)))
+    assert obj.dispatch('on_a', 1) == 'base'
+    assert calls == [('first', 1), ('second', 1), ('base', 1)]
+
+
+def test_subclass_handler_reaches_parent_through_super():
+    calls = []
+    obj = Derived(calls)
+    assert obj.dispatch('on_a', 2) == 'base'
+    assert calls == [('derived', 2), ('base', 2)]
+
+
+def test_unhandled_event_falls_through_to_target():
+    calls = []
+    obj = Base(calls)
+    obj.target = Target(calls)
+    assert obj.dispatch('on_b', 3) == 'target'
+    assert calls == [('target', 3)]
+
+
+def test_async_dispatch_falls_through_from_parent_to_target():
+    calls = []
+    obj = Derived(calls)
+    obj.target = Target(calls)
+    obj.event['on_b'].add_listener(lambda v: calls.append(('listener', v)))
+    assert asyncio.run(obj.dispatch_async('on_b', 4)) == 'target'
+    assert calls == [('listener', 4), ('derived async', 4), ('target', 4)]
+
+
+def test_changes_after_dispatch_are_seen():
+    calls = []
+    obj = Base(calls)
+    obj.dispatch('on_a', 5)
+    obj.event['on_a'].add_listener(lambda v: calls.append(('late', v)))
+    obj.event['on_a'] = lambda v: calls.append(('override', v)) or 'override'
+    assert obj.dispatch('on_a', 6) == 'override'
+    assert calls == [('base', 5), ('late', 6), ('override', 6)]
+
+
+def test_exception_in_listener_does_not_stop_dispatch(capsys):
+    calls = []
+    obj = Base(calls)
+    obj.event['on_a'].add_listener(lambda v: 1 / 0)
+    assert obj.dispatch('on_a', 7) == 'base'
+    assert calls == [('base', 7)]
+    assert 'Exception while dispatching event listener on_a' in capsys.readouterr().out
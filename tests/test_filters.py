@@ -0,0 +1,38 @@
+import pytest
+
+from tgraphics.elements.filterABC import FilterABC
+from tgraphics.elements.filters import Brightness, Opacity, Scale
+
+class Invert(FilterABC):
+    def texture(self, size=None):
+        return self._target.texture(size)
+
+
+def _draw(renderer, element):
+    renderer.clear()
+    element.render((0, 0))
+    renderer.flush()
+    return renderer._renderer.to_surface()
+
+
+def test_chain_is_fused_to_innermost_target(renderer, swatch):
+    element = swatch((20, 20), (200, 100, 255, 255))
+    chain = Opacity(Brightness(Scale(element, size=(40, 40)), 0.5), 0.5)
+    target, size, color = chain._fuse(None)
+    assert target is element
+    assert size == (40, 40)
+    assert color == (127, 127, 127, 127)
+    surface = _draw(renderer, chain)
+    assert element.textures == 1
+    assert tuple(surface.get_at((30, 30)))[:3] == pytest.approx((50, 25, 63), abs=2)
+    assert tuple(surface.get_at((45, 45)))[:3] == (0, 0, 0)
+
+
+def test_fusion_stops_at_unfusable_filter(renderer, swatch):
+    element = swatch((20, 20), (200, 100, 255, 255))
+    inner = Invert(element)
+    chain = Brightness(inner, 0.5)
+    assert not inner.fusable and chain.fusable
+    assert chain._fuse((20, 20))[0] is inner
+    surface = _draw(renderer, chain)
+    assert tuple(surface.get_at((10, 10)))[:3] == pytest.approx((100, 50, 127), abs=2)
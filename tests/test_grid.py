@@ -0,0 +1,120 @@
+import tgraphics
+from tgraphics.core.elementABC import ElementABC
+
+class Box(ElementABC):
+    def __init__(self, size):
+        super().__init__()
+        self._sz = size
+
+    @property
+    def size(self):
+        return self._sz
+
+    def render(self, location, size=None):
+        pass
+
+
+def _hits(grid, x, y, **kwargs):
+    return [sub.element for sub, _ in grid.elements_at(x, y, **kwargs)]
+
+
+def _order(grid):
+    return [sub.element for sub in grid._sub]
+
+
+def test_elements_at_is_top_to_bottom(window):
+    grid = tgraphics.Grid((500, 500))
+    a, b, c = Box((50, 50)), Box((50, 50)), Box((50, 50))
+    grid.add_child_top(a, (0, 0))
+    grid.add_child_top(b, (20, 20))
+    grid.add_child_top(c, (200, 200))
+    assert _hits(grid, 30, 30) == [b, a]
+    assert _hits(grid, 10, 10) == [a]
+    assert _hits(grid, 210, 210) == [c]
+    assert _hits(grid, 150, 150) == []
+    assert _hits(grid, 30, 30, after=b) == [a]
+
+
+def test_elements_at_returns_local_position(window):
+    grid = tgraphics.Grid((500, 500))
+    grid.view = ((100, 0), None)
+    a = Box((50, 50))
+    grid.add_child_top(a, (120, 10))
+    assert [pos for _, pos in grid.elements_at(130, 30)] == [(10, 20)]
+    assert [pos for _, pos in grid.elements_at(30, 30, actual_loc=True)] == [(10, 20)]
+
+
+def test_elements_at_follows_moved_and_large_children(window):
+    grid = tgraphics.Grid((2000, 2000))
+    a, huge = Box((50, 50)), Box((1500, 1500))
+    sub = grid.add_child_top(a, (0, 0))
+    grid.add_child(0, huge, (100, 100))
+    sub.offset = (1000, 1000)
+    assert _hits(grid, 10, 10) == []
+    assert _hits(grid, 1010, 1010) == [a, huge]
+
+
+def test_order_after_insert_and_remove(window):
+    grid = tgraphics.Grid((100, 100))
+    a, b, c, d = (Box((10, 10)) for _ in range(4))
+    grid.add_child_top(a, (0, 0))
+    grid.add_child_top(c, (0, 0))
+    grid.add_child(1, b, (0, 0))
+    grid.add_child(0, d, (0, 0))
+    assert _order(grid) == [d, a, b, c]
+    assert _hits(grid, 5, 5) == [c, b, a, d]
+    grid.remove_child(b)
+    grid.remove_child(0)
+    assert _order(grid) == [a, c]
+    assert _hits(grid, 5, 5) == [c, a]
+    assert grid.pop_child_top() is c
+    assert _hits(grid, 5, 5) == [a]
+
+
+def test_order_after_move(window):
+    grid = tgraphics.Grid((100, 100))
+    a, b, c = (Box((10, 10)) for _ in range(3))
+    for e in (a, b, c):
+        grid.add_child_top(e, (0, 0))
+    grid.move_child_top(a)
+    assert _order(grid) == [b, c, a]
+    grid.move_child_bottom(c)
+    assert _order(grid) == [c, b, a]
+    assert _hits(grid, 5, 5) == [a, b, c]
+    grid.add_child(1, a, (0, 0))
+    assert grid._sub_of(a) is grid._sub.at(1)
+    grid.move_child_top(a)
+    assert _order(grid) == [c, b, a, a]
+
+
+def test_insert_keeps_other_z_keys(window):
+    grid = tgraphics.Grid((100, 100))
+    subs = [grid.add_child_top(Box((10, 10)), (0, 0)) for _ in range(4)]
+    keys = [sub._z for sub in subs]
+    inserted = grid.add_child(2, Box((10, 10)), (0, 0))
+    assert [sub._z for sub in subs] == keys
+    assert list(grid._sub) == [*subs[:2], inserted, *subs[2:]]
+    assert grid._sub.index(inserted) == 2
+
+
+def test_repeated_insert_at_same_index(window):
+    grid = tgraphics.Grid((100, 100))
+    bottom = grid.add_child_top(Box((10, 10)), (0, 0))
+    top = grid.add_child_top(Box((10, 10)), (0, 0))
+    # halving the gap between the same neighbours eventually runs out of floats
+    inserted = [grid.add_child(-1, Box((10, 10)), (0, 0)) for _ in range(100)]
+    assert list(grid._sub) == [bottom, *inserted, top]
+    keys = [sub._z for sub in grid._sub]
+    assert keys == sorted(keys) and len(set(keys)) == len(keys)
+
+
+def test_replace_element_through_subelement(window):
+    grid = tgraphics.Grid((100, 100))
+    a, b = Box((10, 10)), Box((30, 30))
+    sub = grid.add_child_top(a, (0, 0))
+    sub[0] = b
+    assert grid._sub_of(a) is None and grid._sub_of(b) is sub
+    assert _hits(grid, 20, 20) == [b]
+    grid.remove_child(b)
+    assert _order(grid) == []
+    assert _hits(grid, 5, 5) == []
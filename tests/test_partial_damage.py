@@ -0,0 +1,77 @@
+import pytest
+
+import tgraphics
+
+@pytest.fixture
+def scene(window, swatch):
+    root = tgraphics.Grid((200, 200))
+    inner = tgraphics.Grid((100, 100))
+    inner.view = ((20, 0), None)
+    near = swatch((30, 30), (255, 0, 0, 255))
+    far = swatch((30, 30), (0, 0, 255, 255))
+    inner.add_child_top(near, (40, 10))
+    root.add_child_top(inner, (50, 50))
+    root.add_child_top(far, (150, 150))
+    window.render_mode = 'partial'
+    window.target_element = root
+    yield window._window, near, far
+    window.target_element = None
+    window.render_mode = 'per_frame'
+
+
+def _draw_partial_frame(w):
+    renderer = w.renderer
+    w._invalidated = False
+    w._prepare_partial_frame(renderer)
+    w.dispatch('on_draw')
+    w._present_partial_frame(renderer)
+    renderer.flush()
+    return renderer._renderer.to_surface()
+
+
+def test_child_damage_is_translated_to_window_coordinates(scene):
+    w, near, far = scene
+    _draw_partial_frame(w)
+    near.invalidate()
+    assert w._damage == (70, 60, 100, 90)
+
+
+def test_damage_of_several_invalidations_is_united(scene):
+    w, near, far = scene
+    _draw_partial_frame(w)
+    near.invalidate()
+    far.invalidate((0, 0, 10, 10))
+    assert w._damage == (70, 60, 160, 160)
+
+
+def test_whole_window_invalidation_overrides_damage(scene):
+    w, near, far = scene
+    _draw_partial_frame(w)
+    near.invalidate()
+    w.invalidate()
+    assert w._damage is None
+
+
+def test_partial_frame_only_redraws_damage(scene):
+    w, near, far = scene
+    _draw_partial_frame(w)
+    near.color = (0, 255, 0, 255)
+    far.color = (255, 255, 0, 255)
+    near.invalidate()
+    surface = _draw_partial_frame(w)
+    assert tuple(surface.get_at((80, 70)))[:3] == (0, 255, 0)
+    # not invalidated, keeps what was drawn before
+    assert tuple(surface.get_at((160, 160)))[:3] == (0, 0, 255)
+
+
+def test_scaled_grid_reports_whole_damage(window, swatch):
+    grid = tgraphics.Grid((100, 100))
+    element = swatch((10, 10), (255, 0, 0, 255))
+    grid.add_child_top(element, (10, 10))
+    damage = []
+    grid.event['on_invalidate'].add_listener(lambda _element, rect=None: damage.append(rect))
+    grid.render((0, 0))
+    element.invalidate()
+    grid.render((0, 0), (200, 200))
+    element.invalidate()
+    assert damage == [(10, 10, 10, 10), None]
@@ -0,0 +1,42 @@
+import tgraphics
+
+def _cached(grid):
+    return [sub.element for sub, state in grid._render_states.items() if state.texture]
+
+
+def test_cache_stays_within_budget(swatch):
+    policy = tgraphics.RenderCachePolicy(min_frames=2, min_cost=0, budget=2 * 20 * 20)
+    grid = tgraphics.Grid((200, 200))
+    grid.render_cache_policy = policy
+    swatches = [swatch((20, 20), (255, 0, 0, 255)) for _ in range(3)]
+    for i, element in enumerate(swatches):
+        grid.add_child_top(element, (30 * i, 0))
+    for _ in range(10):
+        grid.render((0, 0))
+        assert policy._used <= policy.budget
+        assert policy._used == sum(policy._cached.values())
+        assert len(_cached(grid)) <= 2
+
+
+def test_cache_over_budget_is_not_cached(swatch):
+    policy = tgraphics.RenderCachePolicy(min_frames=1, min_cost=0, budget=10 * 10)
+    grid = tgraphics.Grid((200, 200))
+    grid.render_cache_policy = policy
+    grid.add_child_top(swatch((20, 20), (255, 0, 0, 255)), (0, 0))
+    for _ in range(3):
+        grid.render((0, 0))
+    assert policy._used == 0
+    assert _cached(grid) == []
+
+
+def test_uncached_on_invalidate(swatch):
+    policy = tgraphics.RenderCachePolicy(min_frames=1, min_cost=0)
+    grid = tgraphics.Grid((200, 200))
+    grid.render_cache_policy = policy
+    element = swatch((20, 20), (255, 0, 0, 255))
+    grid.add_child_top(element, (0, 0))
+    grid.render((0, 0))
+    assert _cached(grid) == [element]
+    element.invalidate()
+    assert _cached(grid) == []
+    assert policy._used == 0
@@ -0,0 +1,34 @@
+from array import array
+import importlib
+
+# `tgraphics.backend.pygame.pygame` attribute is shadowed by the star import of pygame itself
+pygame_backend = importlib.import_module('tgraphics.backend.pygame.pygame')
+
+
+def _pixel(renderer, point):
+    return tuple(renderer._renderer.to_surface().get_at(point))[:3]
+
+
+def test_primitives_are_batched_until_flush(renderer):
+    renderer.clear()
+    for i in range(10):
+        renderer.fill_rect((i * 10, 0, 5, 5), (255, 0, 0, 255))
+    assert renderer._batch_func is pygame_backend._submit_fill_rects
+    assert len(renderer._batch) == 40
+    renderer.draw_point((100, 100), (0, 255, 0, 255))
+    assert len(renderer._batch) == 2
+    renderer.flush()
+    assert renderer._batch_func is None
+    assert _pixel(renderer, (92, 2)) == (255, 0, 0)
+    assert _pixel(renderer, (100, 100)) == (0, 255, 0)
+
+
+def test_batch_falls_back_to_one_call_per_primitive(renderer):
+    renderer.clear()
+    renderer.flush()
+    submit = pygame_backend._batch_submitter(None, 4, 'fill_rect')
+    renderer._apply_draw_color((0, 0, 255, 255))
+    submit(renderer, array('f', (0, 0, 5, 5, 20, 20, 5, 5)))
+    assert _pixel(renderer, (2, 2)) == (0, 0, 255)
+    assert _pixel(renderer, (22, 22)) == (0, 0, 255)
+    assert _pixel(renderer, (12, 12)) == (0, 0, 0)
@@ -0,0 +1,49 @@
+import asyncio
+import importlib
+import math
+
+_pygame_backend = importlib.import_module('tgraphics.backend.pygame.pygame')
+
+
+def test_loop_timeout_follows_next_callback():
+    loop = asyncio.new_event_loop()
+    try:
+        assert _pygame_backend._loop_timeout(loop) == math.inf
+        handle = loop.call_later(10, lambda: None)
+        assert 9 < _pygame_backend._loop_timeout(loop) <= 10
+        loop.call_soon(lambda: None)
+        assert _pygame_backend._loop_timeout(loop) == 0
+        handle.cancel()
+    finally:
+        loop.close()
+
+
+def test_loop_timeout_unknown_loop():
+    assert _pygame_backend._loop_timeout(object()) is None
+
+
+def test_idle_window_draws_at_frame_rate(window):
+    runner = _pygame_backend.runner
+    backend_window = window._window
+    backend_window.fps = 20
+    frames = []
+    listener = lambda: frames.append(None)
+    backend_window.event['on_draw'].add_listener(listener)
+
+    async def run():
+        async def stop():
+            await asyncio.sleep(0.5)
+            runner.stop()
+        stopping = asyncio.create_task(stop())
+        await runner.run_all()
+        await stopping
+
+    runner.running = True
+    try:
+        asyncio.run(run())
+    finally:
+        runner.running = False
+        runner.tasks_set.clear()
+        backend_window.event['on_draw'].remove_listener(listener)
+        backend_window.fps = None
+    assert 8 <= len(frames) <= 12
@@ -0,0 +1,56 @@
+import importlib
+
+import pygame
+import pytest
+
+pygame_backend = importlib.import_module('tgraphics.backend.pygame.pygame')
+video = importlib.import_module('tgraphics.backend.pygame._c_pyg.video')
+
+
+def _checker_texture(renderer):
+    surface = pygame.Surface((20, 10))
+    surface.fill((255, 0, 0), (0, 0, 10, 10))
+    surface.fill((0, 0, 255), (10, 0, 10, 10))
+    return pygame_backend.Texture.from_surface(renderer, pygame_backend.Surface(surface))
+
+
+def _draw_batch(renderer, texture):
+    batch = pygame_backend.SpriteBatch(texture)
+    batch.add((0, 0), (0, 0, 10, 10))
+    batch.add((50, 0, 20, 20), (10, 0, 10, 10))
+    batch.add((100, 0))
+    renderer.clear()
+    batch.draw()
+    renderer.flush()
+    surface = renderer._renderer.to_surface()
+    return [tuple(surface.get_at(point))[:3] for point in ((5, 5), (65, 15), (105, 5), (115, 5), (35, 5))]
+
+
+@pytest.fixture
+def unknown_texture_layout(monkeypatch):
+    monkeypatch.setattr(video, '_CHECKED_TEXTURE_LAYOUTS', set())
+    monkeypatch.setattr(video, '_texture_offset', None)
+    yield
+    video._texture_offset = None
+
+
+def test_texture_pointer_of_checked_layout(renderer):
+    texture = _checker_texture(renderer)
+    if tuple(pygame.version.vernum[:2]) not in video._CHECKED_TEXTURE_LAYOUTS:
+        pytest.skip('pygame Texture layout of this version is not checked')
+    assert video.pgtexture_sdl(texture._texture)
+
+
+def test_texture_pointer_of_unknown_layout(renderer, unknown_texture_layout):
+    assert video.pgtexture_sdl(_checker_texture(renderer)._texture) is None
+
+
+_EXPECTED = [(255, 0, 0), (0, 0, 255), (255, 0, 0), (0, 0, 255), (0, 0, 0)]
+
+
+def test_batch_draws_sprites(renderer):
+    assert _draw_batch(renderer, _checker_texture(renderer)) == _EXPECTED
+
+
+def test_batch_falls_back_to_blits(renderer, unknown_texture_layout):
+    assert _draw_batch(renderer, _checker_texture(renderer)) == _EXPECTED
@@ -0,0 +1,26 @@
+import asyncio
+
+import tgraphics
+
+
+def _make_list(swatch):
+    return tgraphics.VirtualList((200, 200), 1000, 24, lambda index, element: swatch((184, 24), (255, 0, 0, 255)))
+
+
+def test_only_visible_rows_are_materialized(swatch):
+    rows = _make_list(swatch)
+    assert sorted(rows._rows) == list(range(0, 11))
+    rows.scroll_to_row(500)
+    assert rows.top == 500 * 24
+    assert sorted(rows._rows) == list(range(498, 511))
+
+
+def test_scroll_over_row_scrolls_list(swatch):
+    rows = _make_list(swatch)
+
+    async def scroll():
+        await rows.dispatch_async('on_mouse_motion', 10, 10, 0, 0)
+        return await rows.dispatch_async('on_mouse_scroll', 10, 10, 0, -1)
+
+    assert asyncio.run(scroll())
+    assert rows.top == 24
@@ -0,0 +1,49 @@
+import gc
+
+from tgraphics.core.eventdispatch import EventDispatcher, event_handler
+
+class Source(EventDispatcher):
+    @event_handler
+    def on_a(self, v):
+        return True
+
+
+class Sink:
+    def __init__(self, calls):
+        self.calls = calls
+
+    def on_a(self, v):
+        self.calls.append(v)
+
+
+def _listeners(source):
+    return source._lookup_helper._listeners[Source]['on_a']
+
+
+def test_weak_listener_is_called_while_alive():
+    calls = []
+    source, sink = Source(), Sink(calls)
+    source.event['on_a'].add_listener(sink.on_a, weak=True)
+    source.dispatch('on_a', 1)
+    assert calls == [1]
+
+
+def test_weak_listener_is_pruned_after_collection():
+    calls = []
+    source, sink = Source(), Sink(calls)
+    source.event['on_a'].add_listener(sink.on_a, weak=True)
+    source.dispatch('on_a', 1)
+    del sink
+    gc.collect()
+    assert _listeners(source) == ()
+    assert source.dispatch('on_a', 2)
+    assert calls == [1]
+
+
+def test_weak_listener_can_be_removed_by_the_original_listener():
+    calls = []
+    source, sink = Source(), Sink(calls)
+    source.event['on_a'].add_listener(sink.on_a, weak=True)
+    source.event['on_a'].remove_listener(sink.on_a)
+    source.dispatch('on_a', 1)
+    assert calls == []
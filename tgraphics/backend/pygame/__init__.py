@@ -3,6 +3,7 @@ pygame (or SDL2 that is under it to be more exact) backend for tgraphics
 """
 
 from .pygame import *
+from .atlas import TextureAtlas, atlas_of
 from . import media
 from . import mouse
 from . import shapes
@@ -0,0 +1,35 @@
+import ctypes
+
+import pygame
+
+_WORD = ctypes.sizeof(ctypes.c_void_p)
+
+# pygame versions (major, minor) of which pygame/src_c/cython/pygame/_sdl2/video.pxd was checked to lay Texture out as
+# (PyObject_HEAD, vtable, SDL_Texture* _tex, Color _color, Renderer renderer, int width, int height)
+_CHECKED_TEXTURE_LAYOUTS = {(2, 6)}
+_TEX_OFFSET = 3 * _WORD
+_RENDERER_OFFSET = 5 * _WORD
+
+# offset of SDL_Texture* in pygame Texture objects, False if the layout of this version of pygame is not known
+_texture_offset = None
+
+def _find_texture_offset(texture):
+    if getattr(pygame, 'IS_CE', False) or tuple(pygame.version.vernum[:2]) not in _CHECKED_TEXTURE_LAYOUTS:
+        return False
+    if type(texture).__basicsize__ < _RENDERER_OFFSET + _WORD:
+        return False
+    # guard against a build not matching the checked layout, the renderer should be where the layout says
+    if ctypes.c_void_p.from_address(id(texture) + _RENDERER_OFFSET).value != id(texture.renderer):
+        return False
+    return _TEX_OFFSET
+
+def pgtexture_sdl(texture):
+    """
+    get SDL_Texture* (as int) of pygame Texture `texture`, None if the Texture layout of this version of pygame is not known
+    """
+    global _texture_offset
+    if _texture_offset is None:
+        _texture_offset = _find_texture_offset(texture)
+    if _texture_offset is False:
+        return None
+    return ctypes.c_void_p.from_address(id(texture) + _texture_offset).value
@@ -37,6 +37,31 @@ class SDL_Window_p(ctypes.c_void_p):
 class SDL_Renderer_p(ctypes.c_void_p):
     pass
 
+class SDL_Texture_p(ctypes.c_void_p):
+    pass
+
+class SDL_Rect(ctypes.Structure):
+    _fields_ = [
+        ('x', ctypes.c_int),
+        ('y', ctypes.c_int),
+        ('w', ctypes.c_int),
+        ('h', ctypes.c_int),
+    ]
+
+class SDL_FRect(ctypes.Structure):
+    _fields_ = [
+        ('x', ctypes.c_float),
+        ('y', ctypes.c_float),
+        ('w', ctypes.c_float),
+        ('h', ctypes.c_float),
+    ]
+
+class SDL_FPoint(ctypes.Structure):
+    _fields_ = [
+        ('x', ctypes.c_float),
+        ('y', ctypes.c_float),
+    ]
+
 
 _sdl2_getrenderer = _sdl2.SDL_GetRenderer
 _sdl2_getrenderer.argtypes = [SDL_Window_p]
@@ -47,12 +72,109 @@ def sdl_getrenderer(window) -> SDL_Renderer_p:
 def sdl_setrenderdrawblendmode(renderer, blendmode):
     _sdl2.SDL_SetRenderDrawBlendMode(renderer, blendmode)
 
+_sdl2_rendersetcliprect = _sdl2.SDL_RenderSetClipRect
+_sdl2_rendersetcliprect.argtypes = [SDL_Renderer_p, ctypes.POINTER(SDL_Rect)]
+_sdl2_rendersetcliprect.restype = ctypes.c_int
+def sdl_rendersetcliprect(renderer, rect):
+    """
+    set clip rect (x, y, w, h) of the current rendering target, disable clipping if `rect` is None
+    """
+    if rect is None:
+        return _sdl2_rendersetcliprect(renderer, None)
+    return _sdl2_rendersetcliprect(renderer, ctypes.byref(SDL_Rect(*rect)))
+
+def _plural_render_func(name, struct):
+    # float plural draw functions are only in SDL >= 2.0.10
+    func = getattr(_sdl2, name, None)
+    if func is None:
+        return None
+    func.argtypes = [SDL_Renderer_p, ctypes.POINTER(struct), ctypes.c_int]
+    func.restype = ctypes.c_int
+    _n_floats = ctypes.sizeof(struct) // ctypes.sizeof(ctypes.c_float)
+
+    def _render(renderer, values):
+        """
+        `values` is a writable buffer of C floats (such as array.array('f')) holding the structs back to back
+        """
+        count = len(values) // _n_floats
+        return func(renderer, (struct * count).from_buffer(values), count)
+
+    return _render
+
+sdl_renderfillrectsf = _plural_render_func('SDL_RenderFillRectsF', SDL_FRect)
+sdl_renderdrawrectsf = _plural_render_func('SDL_RenderDrawRectsF', SDL_FRect)
+sdl_renderdrawlinesf = _plural_render_func('SDL_RenderDrawLinesF', SDL_FPoint)
+sdl_renderdrawpointsf = _plural_render_func('SDL_RenderDrawPointsF', SDL_FPoint)
+
+# SDL_RenderGeometryRaw is only in SDL >= 2.0.18, `sdl_rendergeometryraw` is None on older versions
+_sdl2_rendergeometryraw = getattr(_sdl2, 'SDL_RenderGeometryRaw', None)
+if _sdl2_rendergeometryraw:
+    _sdl2_rendergeometryraw.argtypes = [
+        SDL_Renderer_p, SDL_Texture_p,
+        ctypes.c_void_p, ctypes.c_int,
+        ctypes.c_void_p, ctypes.c_int,
+        ctypes.c_void_p, ctypes.c_int,
+        ctypes.c_int,
+        ctypes.c_void_p, ctypes.c_int, ctypes.c_int,
+    ]
+    _sdl2_rendergeometryraw.restype = ctypes.c_int
+    _float_size = ctypes.sizeof(ctypes.c_float)
+    _int_size = ctypes.sizeof(ctypes.c_int)
+    def sdl_rendergeometryraw(renderer, texture, xy, color, uv, indices, num_indices):
+        """
+        render triangles of `texture` with vertex positions `xy` and texture coordinates `uv` (array.array('f') of x, y pairs),
+        all vertices are modulated by `color` (4 bytes, r, g, b, a), `indices` (array.array('i')) index the
+        vertices, three per triangle, only the first `num_indices` are used
+        """
+        _xy, _color, _uv, _indices = xy.buffer_info()[0], color.buffer_info()[0], uv.buffer_info()[0], indices.buffer_info()[0]
+        return _sdl2_rendergeometryraw(
+            renderer, texture,
+            _xy, 2 * _float_size,
+            _color, 0,
+            _uv, 2 * _float_size,
+            len(xy) // 2,
+            _indices, num_indices, _int_size,
+        )
+else:
+    sdl_rendergeometryraw = None
+
 _sdl2_getwindowfromid = _sdl2.SDL_GetWindowFromID
 _sdl2_getwindowfromid.argtypes = [ctypes.c_uint32]
 _sdl2_getwindowfromid.restype = SDL_Window_p
 def sdl_getwindowfromid(id) -> SDL_Window_p:
     return _sdl2_getwindowfromid(ctypes.c_uint32(id))
 
+class SDL_DisplayMode(ctypes.Structure):
+    _fields_ = [
+        ('format', ctypes.c_uint32),
+        ('w', ctypes.c_int),
+        ('h', ctypes.c_int),
+        ('refresh_rate', ctypes.c_int),
+        ('driverdata', ctypes.c_void_p),
+    ]
+
+_sdl2_getwindowdisplaymode = _sdl2.SDL_GetWindowDisplayMode
+_sdl2_getwindowdisplaymode.argtypes = [SDL_Window_p, ctypes.POINTER(SDL_DisplayMode)]
+_sdl2_getwindowdisplaymode.restype = ctypes.c_int
+def sdl_getwindowrefreshrate(window: SDL_Window_p) -> int:
+    """
+    refresh rate (in Hz) of the display mode `window` uses when visible, 0 if unknown
+    """
+    mode = SDL_DisplayMode()
+    if _sdl2_getwindowdisplaymode(window, ctypes.byref(mode)):
+        return 0
+    return mode.refresh_rate
+
+_sdl2_waiteventtimeout = _sdl2.SDL_WaitEventTimeout
+_sdl2_waiteventtimeout.argtypes = [ctypes.POINTER(SDL_Event), ctypes.c_int]
+_sdl2_waiteventtimeout.restype = ctypes.c_int
+def sdl_waiteventtimeout(timeout) -> bool:
+    """
+    pump events and block until there is an event in the queue or `timeout` (in milliseconds) passed,
+    events are left in the queue, the GIL is released while waiting
+    """
+    return bool(_sdl2_waiteventtimeout(None, int(timeout)))
+
 def sdl_capturemouse(enabled):
     _sdl2.SDL_CaptureMouse(ctypes.c_bool(enabled))
 
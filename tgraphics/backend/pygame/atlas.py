@@ -0,0 +1,157 @@
+import pygame
+from typing import Optional
+import weakref
+
+from .pygame import _PygameClsSdlTexture, BlendMode, Renderer, Surface, Texture
+
+from ...utils.typehint import *
+
+# SDL_PIXELFORMAT_ARGB8888, the format of textures created by pygame
+_PAGE_MASKS = (0xff0000, 0xff00, 0xff, 0xff000000)
+
+class _Slot:
+    def __init__(self, surface, size):
+        # the page is a static texture that cannot be read back, repack uploads regions again from here
+        self.surface = surface
+        self.size = size
+        self.page = None
+        self.pos = None
+        self.handle = None
+
+
+class _Page:
+    """
+    texture of an atlas packed with shelves: rows which regions are placed side by side in
+    """
+    def __init__(self, renderer: Renderer, size):
+        self.size = size
+        self.texture = _PygameClsSdlTexture(renderer._renderer, (size, size), static=True)
+        self.texture.blend_mode = int(BlendMode.BLENDMODE_BLEND)
+        self.texture.update(pygame.Surface((size, size), pygame.SRCALPHA, 32, masks=_PAGE_MASKS))
+        self.reset()
+
+    def reset(self):
+        # [y, height, used width]
+        self.shelves = []
+        self.bottom = 0
+        self.slots = set()
+        self.area = 0
+
+    def pack(self, w, h) -> Optional[Tuple[int, int]]:
+        fit = None
+        for shelf in self.shelves:
+            if h <= shelf[1] and shelf[2] + w <= self.size and (not fit or shelf[1] < fit[1]):
+                fit = shelf
+        # do not waste a tall shelf on a short region while there is room for a new shelf
+        if fit and (fit[1] <= h * 3 / 2 or self.bottom + h > self.size):
+            fit[2] += w
+            return (fit[2] - w, fit[0])
+        if self.bottom + h <= self.size:
+            self.shelves.append([self.bottom, h, w])
+            self.bottom += h
+            return (0, self.bottom - h)
+        return None
+
+
+class TextureAtlas:
+    """
+    packs small surfaces of a renderer into shared textures (pages) so that drawing them does not
+    switch textures, textures given out are regions of pages and are freed when garbage collected
+
+    pages are static textures, which unlike render targets keep their content when SDL resets render targets,
+    so a copy of every live region (no larger than `max_region_size`) is kept in memory for repacking
+    """
+    def __init__(self, renderer: Renderer, page_size=1024, max_region_size=256, padding=1):
+        self._renderer = renderer
+        self._page_size = page_size
+        self._max_region_size = max_region_size
+        self._padding = padding
+        self._pages: List[_Page] = list()
+
+    def texture_from_surface(self, surface: Surface) -> Texture:
+        """
+        get texture of `surface`, surfaces larger than `max_region_size` get their own texture
+        """
+        w, h = surface.size
+        if w > self._max_region_size or h > self._max_region_size:
+            return Texture.from_surface(self._renderer, surface)
+
+        slot = _Slot(surface._surface.convert(pygame.Surface((1, 1), pygame.SRCALPHA, 32, masks=_PAGE_MASKS)), (w, h))
+        if not self._pack(slot):
+            if self._fragmented():
+                self.repack()
+            if not self._pack(slot):
+                self._pages.append(_Page(self._renderer, self._page_size))
+                self._pack(slot)
+        self._upload(slot)
+
+        handle = Texture((self._renderer, slot.page.texture), (*slot.pos, w, h))
+        slot.handle = weakref.ref(handle)
+        weakref.finalize(handle, self._free, slot)
+        return handle
+
+    def _pack(self, slot: _Slot):
+        w, h = slot.size
+        for page in self._pages:
+            pos = page.pack(w + self._padding, h + self._padding)
+            if pos:
+                slot.page, slot.pos = page, pos
+                page.slots.add(slot)
+                page.area += w * h
+                return True
+        return False
+
+    def _upload(self, slot: _Slot):
+        w, h = slot.size
+        page = slot.page
+        if self._padding:
+            # freed regions leave their pixels behind, clear the padding so that it does not bleed into this region
+            page.texture.update(
+                pygame.Surface((w + self._padding, h + self._padding), pygame.SRCALPHA, 32, masks=_PAGE_MASKS),
+                (*slot.pos, w + self._padding, h + self._padding)
+            )
+        page.texture.update(slot.surface, (*slot.pos, w, h))
+
+    def _free(self, slot: _Slot):
+        page = slot.page
+        page.slots.discard(slot)
+        page.area -= slot.size[0] * slot.size[1]
+        if not page.slots:
+            page.reset()
+
+    def _fragmented(self):
+        """
+        whether live regions would fit in noticeably fewer pages if packed again
+        """
+        if not self._pages:
+            return False
+        return sum(page.area for page in self._pages) < len(self._pages) * self._page_size * self._page_size / 2
+
+    def repack(self):
+        """
+        pack live regions again, regions given out are updated in place
+        """
+        # hold the handles so that none is finalized (freeing its slot) while regions move
+        handles = {slot: slot.handle() for page in self._pages for slot in page.slots}
+        for page in self._pages:
+            page.reset()
+        for slot in sorted(handles, key=lambda slot: slot.size[1], reverse=True):
+            if not self._pack(slot):
+                self._pages.append(_Page(self._renderer, self._page_size))
+                self._pack(slot)
+            self._upload(slot)
+            handle = handles[slot]
+            if handle:
+                handle._texture = slot.page.texture
+                handle._rect = (*slot.pos, *slot.size)
+        self._pages = [page for page in self._pages if page.slots]
+
+
+def atlas_of(renderer: Renderer) -> TextureAtlas:
+    """
+    get the texture atlas of `renderer`
+    """
+    atlas = renderer._atlas
+    if not atlas:
+        atlas = renderer._atlas = TextureAtlas(renderer)
+    return atlas
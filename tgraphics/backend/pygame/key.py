@@ -46,3 +46,9 @@ for k in dir(locals):
 globals().update(_keys)
 
 Keys = IntEnum('Keys', _keys)
+
+# canonical member for every key value, Keys(value) raising ValueError is too slow for every key event
+_keys_from_value = {k.value: k for k in Keys}
+
+def _key_from_pyg(_pyg):
+    return _keys_from_value.get(_pyg, _pyg)
@@ -151,7 +151,7 @@ class PatchedPlayer(pyglet.media.Player):
 
         image = source.get_next_video_frame()
         if image is not None:
-            self._tplayer._image = image
+            self._tplayer._set_image(image)
 
         ts = source.get_next_video_timestamp()
         if ts is None:
@@ -1,18 +1,27 @@
+import asyncio
 from collections import defaultdict
 import pyglet
+from weakref import WeakKeyDictionary, WeakSet
 
-from ...pygame import current_renderer
+from ...pygame import cleanup_coro_done, current_renderer
 
 class _PygletClockBinder:
+    # longest time (in seconds) between pyglet clock ticks while players are playing
+    MAX_TICK_PERIOD = 1/60
+
     def __init__(self) -> None:
-        self.players = defaultdict(set)
-        self.windows = dict()
+        # weak so that a player dropped without calling delete does not stay alive through its window
+        self.players = defaultdict(WeakSet)
+        self.windows = WeakKeyDictionary()
+        self._ticker = None
 
     def add_player(self, player, window):
-        window.event['on_draw'].add_listener(player.tick)
-        window.event['on_destroy'].add_listener(player.delete)
+        # players can be started before the event loop runs, the ticker is started on the next draw instead
+        window.event['on_draw'].add_listener(self._start_ticker)
+        window.event['on_destroy'].add_listener(player.delete, weak=True)
         self.players[window].add(player)
         self.windows[player] = window
+        window.invalidate()
 
     def remove_player(self, player):
         try:
@@ -22,7 +31,28 @@ class _PygletClockBinder:
             return
         del self.windows[player]
         self.players[window].discard(player)
-        window.event['on_draw'].remove_listener(player.tick)
+        window.event['on_draw'].remove_listener(self._start_ticker)
         window.event['on_destroy'].remove_listener(player.delete)
 
+    def _start_ticker(self, *args):
+        if not self._ticker:
+            self._ticker = asyncio.create_task(self._tick())
+            cleanup_coro_done(self._ticker)
+        return False
+
+    async def _tick(self):
+        """
+        tick players on a timer rather than on draw, so that playing does not keep the window rendering,
+        players invalidate on new video frames
+        """
+        clock = pyglet.clock.get_default()
+        try:
+            while self.windows:
+                for player in list(self.windows.keys()):
+                    player.tick()
+                sleep_time = clock.get_sleep_time(True)
+                await asyncio.sleep(self.MAX_TICK_PERIOD if sleep_time is None else min(sleep_time, self.MAX_TICK_PERIOD))
+        finally:
+            self._ticker = None
+
 pyglet_clock_binder = _PygletClockBinder()
@@ -7,6 +7,7 @@ from pathlib import Path
 import sys
 
 from ...pygame import Texture, current_renderer
+from .....core.eventdispatch import EventDispatcher
 
 # Windows shit
 if sys.platform.startswith('win'):
@@ -25,11 +26,16 @@ if sys.platform.startswith('win'):
 
 from . import _player_patch
 
-class Player:
+class Player(EventDispatcher):
     def __init__(self):
+        super().__init__()
         self._image = None
         self._player = _player_patch.PatchedPlayer(self)
 
+    def _set_image(self, image):
+        self._image = image
+        self.dispatch('on_new_frame')
+
     def play(self, window):
         self._player.play(window=window)
 
@@ -1,7 +1,9 @@
+from array import array
 import asyncio
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 import datetime
 from enum import Enum, IntEnum
+import math
 import os
 import time
 import traceback
@@ -10,9 +12,10 @@ os.environ['PYGAME_FREETYPE'] = "1"
 import pygame
 
 from . import _mouse
-from .key import Keys
+from .key import Keys, _key_from_pyg
 from ._c_sdl.sdl2 import *
 from ._c_pyg.event import pgevent_new
+from ._c_pyg.video import pgtexture_sdl
 from ...core.eventdispatch import EventDispatcher, event_handler
 from ...utils.typehint import *
 
@@ -38,6 +41,85 @@ if sys.platform == 'win32':
     _HWNDMap = dict() # type: Dict[int, Window]
 _Windows = set() # type: Set[Window]
 
+class _TargetProxy:
+    """
+    `renderer.target`, reusable so that `with renderer.target(texture):` does not allocate
+    """
+    def __init__(self, renderer: 'Renderer'):
+        self._renderer = renderer
+        self._pending = None
+        self._replacing = []
+
+    def get(self):
+        return self._renderer._renderer.target
+
+    def __call__(self, new_target):
+        self._pending = new_target
+        return self
+
+    def __enter__(self):
+        self._replacing.append(self._renderer._target)
+        self._renderer.target = self._pending
+        self._pending = None
+
+    def __exit__(self, type, value, traceback):
+        self._renderer.target = self._replacing.pop()
+
+
+class _DrawColorProxy:
+    """
+    `renderer.draw_color`, reusable so that `with renderer.draw_color(color):` does not allocate
+    """
+    def __init__(self, renderer: 'Renderer'):
+        self._renderer = renderer
+        self._pending = None
+        self._replacing = []
+
+    def get(self):
+        return self._renderer._color
+
+    def __call__(self, new_color):
+        self._pending = new_color
+        return self
+
+    def __enter__(self):
+        self._replacing.append(self._renderer._color)
+        self._renderer.draw_color = self._pending
+        self._pending = None
+
+    def __exit__(self, type, value, traceback):
+        self._renderer.draw_color = self._replacing.pop()
+
+
+def _batch_submitter(plural, n_floats, draw_one):
+    """
+    function submitting primitives queued by a Renderer with SDL plural draw function `plural`,
+    or with one call of pygame renderer method `draw_one` per primitive of `n_floats` floats if SDL does not have `plural`
+    """
+    if plural:
+        def _submit(renderer, values):
+            plural(renderer._ctype, values)
+    else:
+        def _submit(renderer, values):
+            _draw_one = getattr(renderer._renderer, draw_one)
+            for i in range(0, len(values), n_floats):
+                _draw_one(values[i:i + n_floats])
+    return _submit
+
+_submit_fill_rects = _batch_submitter(sdl_renderfillrectsf, 4, 'fill_rect')
+_submit_draw_rects = _batch_submitter(sdl_renderdrawrectsf, 4, 'draw_rect')
+_submit_draw_points = _batch_submitter(sdl_renderdrawpointsf, 2, 'draw_point')
+
+if sdl_renderdrawlinesf:
+    def _submit_draw_lines(renderer, values):
+        sdl_renderdrawlinesf(renderer._ctype, values)
+else:
+    def _submit_draw_lines(renderer, values):
+        _draw_line = renderer._renderer.draw_line
+        for i in range(0, len(values) - 2, 2):
+            _draw_line(values[i:i + 2], values[i + 2:i + 4])
+
+
 class Renderer:
     def __init__(self, _pyg):
         self._window, self._renderer = _pyg
@@ -45,6 +127,22 @@ class Renderer:
             self._ctype = _WindowsMap[self._window]._renderer._ctype
         except KeyError:
             self._ctype = sdl_getrenderer(self._window._ctype)
+        # target -> clip rect, SDL drops clip rect when switching target
+        self._clips = dict()
+        self._target = None
+        self._target_proxy = _TargetProxy(self)
+        # draw color is only applied to SDL (along with draw blend mode) right before drawing
+        self._color = (0, 0, 0, 255)
+        self._applied_color = None
+        self._applied_blend = None
+        self._draw_color_proxy = _DrawColorProxy(self)
+        # same color primitives are queued and submitted at once with SDL plural draw functions (one by one on SDL < 2.0.10)
+        self._batch_func = None
+        self._batch_color = None
+        self._batch = array('f')
+        # created by `atlas.atlas_of` and `pool_of` when needed
+        self._atlas = None
+        self._pool = None
 
     def __hash__(self):
         return hash(self._window.id)
@@ -60,91 +158,131 @@ class Renderer:
 
     @property
     def target(self):
-        class _TargetGetProxy:
-            def __init__(self, renderer):
-                self._renderer = renderer
-
-            def get(self):
-                return self._renderer._renderer.target
-
-            def __call__(self, new_target):
-                class _TargetCtxMgrProxy:
-                    def __init__(self, renderer):
-                        self._renderer = renderer
-                        self._replacing = []
-
-                    def __enter__(self):
-                        self._replacing.append(Texture((self._renderer, self._renderer._renderer.target)))
-                        self._renderer.target = new_target
-
-                    def __exit__(self, type, value, traceback):
-                        self._renderer.target = self._replacing.pop()
-                
-                return _TargetCtxMgrProxy(self._renderer)
-
-        return _TargetGetProxy(self)
+        return self._target_proxy
 
     @target.setter
     def target(self, new_target):
-        if new_target:
-            self._renderer.target = new_target._texture
+        _texture = new_target._texture if new_target else None
+        self._target = new_target
+        if _texture is self._renderer.target:
+            return
+        self.flush()
+        self._renderer.target = _texture
+        rect = self._clips.get(_texture)
+        if rect:
+            sdl_rendersetcliprect(self._ctype, rect)
+
+    @property
+    def clip_rect(self):
+        """
+        clip rect (x, y, w, h) of the current target, None if not clipping
+        """
+        return self._clips.get(self._renderer.target)
+
+    @clip_rect.setter
+    def clip_rect(self, rect):
+        self.flush()
+        if rect is not None:
+            x, y = math.floor(rect[0]), math.floor(rect[1])
+            rect = (x, y, max(math.ceil(rect[0] + rect[2]) - x, 0), max(math.ceil(rect[1] + rect[3]) - y, 0))
+            self._clips[self._renderer.target] = rect
         else:
-            self._renderer.target = None
+            self._clips.pop(self._renderer.target, None)
+        sdl_rendersetcliprect(self._ctype, rect)
 
     @property
     def draw_color(self):
-        class _ColorGetProxy:
-            def __init__(self, renderer):
-                self._renderer = renderer
-
-            def get(self):
-                return self._renderer._renderer.draw_color
-
-            def __call__(self, new_color):
-                class _ColorCtxMgrProxy:
-                    def __init__(self, renderer):
-                        self._renderer = renderer
-                        self._replacing = []
-
-                    def __enter__(self):
-                        self._replacing.append(self._renderer._renderer.draw_color)
-                        self._renderer.draw_color = new_color
-
-                    def __exit__(self, type, value, traceback):
-                        self._renderer.draw_color = self._replacing.pop()
-                
-                return _ColorCtxMgrProxy(self._renderer)
-
-        return _ColorGetProxy(self)
+        return self._draw_color_proxy
 
     @draw_color.setter
     def draw_color(self, new_color):
-        self._renderer.draw_color = new_color
-        if new_color[3] < 255:
-            sdl_setrenderdrawblendmode(self._ctype, BlendMode.BLENDMODE_BLEND)
-        else:
-            sdl_setrenderdrawblendmode(self._ctype, BlendMode.BLENDMODE_NONE)
+        self._color = new_color
 
-    def clear(self):
-        with self.draw_color((0, 0, 0, 255)):
-            self._renderer.clear()
+    def _apply_draw_color(self, color):
+        if color == self._applied_color:
+            return
+        self._renderer.draw_color = color
+        self._applied_color = color
+        blend = BlendMode.BLENDMODE_BLEND if color[3] < 255 else BlendMode.BLENDMODE_NONE
+        if blend != self._applied_blend:
+            sdl_setrenderdrawblendmode(self._ctype, blend)
+            self._applied_blend = blend
+
+    def _start_batch(self, func, color):
+        self.flush()
+        self._batch_func = func
+        self._batch_color = color
+
+    def flush(self):
+        """
+        submit queued primitives to SDL
+        """
+        if not self._batch_func:
+            return
+        self._apply_draw_color(self._batch_color)
+        self._batch_func(self, self._batch)
+        self._batch_func = None
+        self._batch = array('f')
+
+    def clear(self, color=(0, 0, 0, 255)):
+        self.flush()
+        self._apply_draw_color(color)
+        self._renderer.clear()
 
     def update(self):
+        self.flush()
         self._renderer.present()
 
-    def draw_line(self, p1, p2):
-        self._renderer.draw_line(p1, p2)
+    # primitives are drawn with `color` if specified, current draw color otherwise
 
-    def draw_point(self, point):
-        self._renderer.draw_point(point)
+    def draw_line(self, p1, p2, color=None):
+        color = color if color else self._color
+        _batch = self._batch
+        # consecutive lines sharing an end point are submitted as one polyline
+        if self._batch_func is not _submit_draw_lines or color != self._batch_color or _batch[-2] != p1[0] or _batch[-1] != p1[1]:
+            self._start_batch(_submit_draw_lines, color)
+            self._batch.extend(p1)
+        self._batch.extend(p2)
 
-    def draw_rect(self, rect):
-        self._renderer.draw_rect(rect)
-
-    def fill_rect(self, rect):
-        self._renderer.fill_rect(rect)
+    def draw_lines(self, points, color=None):
+        """
+        draw connected lines through `points`
+        """
+        self._start_batch(_submit_draw_lines, color if color else self._color)
+        for point in points:
+            self._batch.extend(point)
+        self.flush()
+
+    def draw_point(self, point, color=None):
+        color = color if color else self._color
+        if self._batch_func is not _submit_draw_points or color != self._batch_color:
+            self._start_batch(_submit_draw_points, color)
+        self._batch.extend(point)
+
+    def draw_points(self, points, color=None):
+        for point in points:
+            self.draw_point(point, color)
+
+    def draw_rect(self, rect, color=None):
+        color = color if color else self._color
+        if self._batch_func is not _submit_draw_rects or color != self._batch_color:
+            self._start_batch(_submit_draw_rects, color)
+        self._batch.extend(rect)
+
+    def fill_rect(self, rect, color=None):
+        color = color if color else self._color
+        if self._batch_func is not _submit_fill_rects or color != self._batch_color:
+            self._start_batch(_submit_fill_rects, color)
+        self._batch.extend(rect)
+
+    def fill_rects(self, rects, color=None):
+        for rect in rects:
+            self.fill_rect(rect, color)
 
 class Window(EventDispatcher):
+    # frame rate used when no fps is set and the display does not report its refresh rate
+    DEFAULT_REFRESH_RATE = 60
+
     def __init__(self, _pyg):
         super().__init__()
         self._window = _pyg
@@ -184,6 +322,18 @@ class Window(EventDispatcher):
         window._draw_time = datetime.timedelta()
         window._frame_delta = None
         window._target_fps = None
+        window._render_mode = 'per_frame'
+        window._invalidated = True
+        window._redraw_event = None
+        # perf_counter time before which the next frame is not drawn, None to draw right away
+        window._next_frame_time = None
+        # bounds (x0, y0, x1, y1) to be redrawn in 'partial' render mode, None for the whole window
+        window._damage = None
+        window._frame_texture = None
+
+        # window content might be lost or exposed
+        for e in ('on_resize', 'on_show', 'on_restored', 'on_maximized', 'on_expose'):
+            window.event[e].add_listener(lambda *args: window.invalidate())
 
         on_draw_finished_event = window.event['on_draw_finished']
         @on_draw_finished_event.add_listener
@@ -263,6 +413,7 @@ class Window(EventDispatcher):
     def destroy(self):
         self.dispatch('on_destroy')
         _Windows.remove(self)
+        self._wake_draw_schedule()
         self._window.destroy()
 
     @property
@@ -325,22 +476,110 @@ class Window(EventDispatcher):
         else:
             Window.get(self._window).fps = fps
 
+    @property
+    def render_mode(self):
+        """
+        'per_frame' to render every frame, 'on_demand' to only render after the window is invalidated
+        or 'partial' to only redraw invalidated regions after the window is invalidated
+        """
+        return self._render_mode
+
+    @render_mode.setter
+    def render_mode(self, mode):
+        if mode not in ('per_frame', 'on_demand', 'partial'):
+            raise ValueError('unknown render mode `{}`'.format(mode))
+        self._render_mode = mode
+        self.invalidate()
+
+    def invalidate(self, rect=None):
+        """
+        request the window to be rendered again
+
+        parameters:
+            [rect]
+                damaged region (x, y, w, h), the whole window if unspecified
+        """
+        if rect is None:
+            self._damage = None
+        else:
+            bounds = (rect[0], rect[1], rect[0] + rect[2], rect[1] + rect[3])
+            if not self._invalidated:
+                self._damage = bounds
+            elif self._damage is not None:
+                damage = self._damage
+                self._damage = (min(damage[0], bounds[0]), min(damage[1], bounds[1]), max(damage[2], bounds[2]), max(damage[3], bounds[3]))
+        self._invalidated = True
+        self._wake_draw_schedule()
+
+    def _prepare_partial_frame(self, renderer):
+        """
+        set renderer target to the retained frame texture, clipped and cleared to the damaged region
+        """
+        damage = self._damage
+        self._damage = None
+        size = self.size
+        if not self._frame_texture or self._frame_texture.size != size:
+            self._frame_texture = Texture.create_as_target(renderer, size)
+            damage = None
+        renderer.target = self._frame_texture
+        if damage is None:
+            renderer.clear()
+        else:
+            rect = (damage[0], damage[1], damage[2] - damage[0], damage[3] - damage[1])
+            renderer.clip_rect = rect
+            rect = renderer.clip_rect
+            with renderer.draw_color((0, 0, 0, 255)):
+                renderer.fill_rect(rect)
+
+    def _present_partial_frame(self, renderer):
+        renderer.clip_rect = None
+        renderer.target = None
+        self._frame_texture.blit_to_target()
+
+    def _wake_draw_schedule(self):
+        if self._redraw_event:
+            self._redraw_event.set()
+
+    def _frame_period(self):
+        """
+        shortest time (in seconds) between the start of two frames, from the target fps or the display refresh rate
+        """
+        fps = self._target_fps or sdl_getwindowrefreshrate(self._ctype) or self.DEFAULT_REFRESH_RATE
+        return 1 / fps
+
     async def draw_schedule(self):
+        self._redraw_event = asyncio.Event()
         while runner.running:
             if self not in _Windows:
                 break
+            if self._render_mode != 'per_frame':
+                if not self._invalidated:
+                    await self._redraw_event.wait()
+                    self._redraw_event.clear()
+                    continue
+            if self._next_frame_time is not None:
+                # a timer rather than a busy loop, the runner blocks for input until the earliest one is due
+                delay = self._next_frame_time - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                    if not runner.running or self not in _Windows:
+                        break
+            partial = self._render_mode == 'partial'
             renderer = self.renderer
-            renderer.target = None
-            renderer.clear()
+            # take damage after waiting for the frame so that it includes invalidations while waiting
+            self._invalidated = False
+            if partial:
+                self._prepare_partial_frame(renderer)
+            else:
+                renderer.target = None
+                renderer.clear()
             self._current_start_time = time.perf_counter()
-            if self._target_fps and self._current_frame_time:
-                target_time = datetime.timedelta(seconds=1) / self._target_fps
-                expect_time = datetime.timedelta(seconds=self._current_start_time - self._current_frame_time) + self._draw_time
-                await asyncio.sleep((target_time-expect_time).total_seconds())
             runner.current_renderer = renderer
             self.dispatch('on_draw')
+            if partial:
+                self._present_partial_frame(renderer)
             renderer.update()
-            await asyncio.sleep(0)
+            self._next_frame_time = max(self._current_start_time + self._frame_period(), time.perf_counter())
 
 
 class Surface:
@@ -429,8 +668,28 @@ class TextureAccessEnum(Enum):
 
 
 class Texture:
-    def __init__(self, _pyg=None):
+    def __init__(self, _pyg=None, rect=None):
+        """
+        `rect` (x, y, w, h) makes this texture a region of the underlying texture (such as an atlas page),
+        color, alpha and blend mode are then shared with the underlying texture
+        """
         self._renderer, self._texture = _pyg
+        self._rect = rect
+        # pool this texture is acquired from, see `TexturePool`
+        self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.release()
+
+    def release(self):
+        """
+        give this texture back to the pool it is acquired from, does nothing if it is not from a pool
+        """
+        if self._pool:
+            self._pool._release(self)
 
     @staticmethod
     def create(renderer: Renderer, size, access: TextureAccessEnum=TextureAccessEnum.Static, blend=None):
@@ -472,11 +731,11 @@ class Texture:
 
     @property
     def w(self):
-        return self._texture.width
+        return self._rect[2] if self._rect else self._texture.width
 
     @property
     def h(self):
-        return self._texture.height
+        return self._rect[3] if self._rect else self._texture.height
 
     @property
     def size(self):
@@ -494,7 +753,7 @@ class Texture:
     def renderer(self):
         return self._renderer
 
-    def blit_to_target(self, src_rect=None, dst_rect_or_coord=None, angle=0, origin=None, flipX=False, flipY=False):
+    def blit_to_target(self, src_rect=None, dst_rect_or_coord=None, angle=0, origin=None, flipX=False, flipY=False, color=None):
         """
         copy this texture (or a portion of it if `src_coord` is specified) to the rendering target.
         
@@ -512,16 +771,43 @@ class Texture:
                 flip horizontally
             [flipY]
                 flip vertically
+            [color]
+                color (r, g, b) or (r, g, b, a) to modulate the texture with while drawing, a texture without
+                blending is blended if alpha is specified (as `as_color_mod` does)
         """
-        self._texture.draw(src_rect, dst_rect_or_coord, angle, origin, flipX, flipY)
+        self._renderer.flush()
+        if self._rect:
+            _x, _y = self._rect[0], self._rect[1]
+            src_rect = (_x + src_rect[0], _y + src_rect[1], src_rect[2], src_rect[3]) if src_rect else self._rect
+            # pygame sizes coord destination by the whole underlying texture
+            if dst_rect_or_coord and len(dst_rect_or_coord) == 2:
+                dst_rect_or_coord = (*dst_rect_or_coord, src_rect[2], src_rect[3])
+        if not color:
+            self._texture.draw(src_rect, dst_rect_or_coord, angle, origin, flipX, flipY)
+            return
 
-    def draw(self, location, size=None):
+        _texture = self._texture
+        _orig_col = (_texture.color, _texture.alpha, _texture.blend_mode)
+        _texture.color = color[0:3]
+        if len(color) > 3:
+            _texture.alpha = color[3]
+            if _orig_col[2] == BlendMode.BLENDMODE_NONE:
+                _texture.blend_mode = BlendMode.BLENDMODE_BLEND
+        _texture.draw(src_rect, dst_rect_or_coord, angle, origin, flipX, flipY)
+        _texture.color = _orig_col[0]
+        _texture.alpha = _orig_col[1]
+        _texture.blend_mode = _orig_col[2]
+
+    def draw(self, location, size=None, color=None):
         if size:
             raise NotImplementedError()
         else:
-            self.blit_to_target(dst_rect_or_coord=location)
+            self.blit_to_target(dst_rect_or_coord=location, color=color)
 
-    def as_color_mod(self, color):
+    def as_color_mod(self, color, pooled=False):
+        """
+        copy of this texture modulated by `color`, the copy is acquired from the renderer's `TexturePool` if `pooled`
+        """
         _orig_col = (self._texture.color, self._texture.alpha, self._texture.blend_mode)
         self._texture.color = color[0:3]
         blend = _orig_col[2]
@@ -531,7 +817,10 @@ class Texture:
             if _orig_col[2] == BlendMode.BLENDMODE_NONE:
                 blend = BlendMode.BLENDMODE_BLEND
 
-        new_tex = Texture.create(self._renderer, self.size, TextureAccessEnum.Target, blend=blend)
+        if pooled:
+            new_tex = pool_of(self._renderer).acquire(self.size, blend)
+        else:
+            new_tex = Texture.create(self._renderer, self.size, TextureAccessEnum.Target, blend=blend)
 
         with self._renderer.target(new_tex):
             self.blit_to_target()
@@ -542,8 +831,14 @@ class Texture:
 
         return new_tex
 
-    def as_size(self, size):
-        new_tex = Texture.create(self._renderer, size, TextureAccessEnum.Target)
+    def as_size(self, size, pooled=False):
+        """
+        copy of this texture scaled to `size`, the copy is acquired from the renderer's `TexturePool` if `pooled`
+        """
+        if pooled:
+            new_tex = pool_of(self._renderer).acquire(size)
+        else:
+            new_tex = Texture.create(self._renderer, size, TextureAccessEnum.Target)
 
         with self._renderer.target(new_tex):
             self.blit_to_target()
@@ -551,6 +846,219 @@ class Texture:
         return new_tex
 
 
+class TexturePool:
+    """
+    keeps released render target textures of a renderer for reuse so that temporary textures (such as of filters)
+    do not allocate every frame
+
+    textures are given out cleared to transparent, give them back with `Texture.release` or by using them as a
+    context manager (`with pool.acquire(size) as texture:`), idle textures past `max_textures` or `max_bytes`
+    are dropped least recently released first
+    """
+    def __init__(self, renderer: Renderer, max_textures=32, max_bytes=64 * 1024 * 1024):
+        self._renderer = renderer
+        self._max_textures = max_textures
+        self._max_bytes = max_bytes
+        # (size, blend) -> idle textures, all pygame render targets are ARGB8888 so format is not part of the key
+        self._idle: Dict[Tuple[Tuple[int, int], BlendMode], List[Texture]] = dict()
+        # idle texture -> key, least recently released first
+        self._lru: 'OrderedDict[Texture, Tuple[Tuple[int, int], BlendMode]]' = OrderedDict()
+        self._bytes = 0
+
+    def acquire(self, size, blend=None) -> Texture:
+        """
+        get a render target texture of `size` with blend mode `blend` (BLENDMODE_NONE if unspecified)
+        """
+        size = (round(size[0]), round(size[1]))
+        key = (size, BlendMode(blend) if blend else BlendMode.BLENDMODE_NONE)
+        textures = self._idle.get(key)
+        if textures:
+            texture = textures.pop()
+            del self._lru[texture]
+            self._bytes -= size[0] * size[1] * 4
+        else:
+            texture = Texture.create(self._renderer, size, TextureAccessEnum.Target, blend=blend)
+        texture._pool = self
+        with self._renderer.target(texture):
+            self._renderer.clear((0, 0, 0, 0))
+        return texture
+
+    def _release(self, texture: Texture):
+        texture._pool = None
+        _texture = texture._texture
+        _texture.color = (255, 255, 255)
+        _texture.alpha = 255
+        key = (texture.size, texture.blend_mode)
+        self._idle.setdefault(key, []).append(texture)
+        self._lru[texture] = key
+        self._bytes += key[0][0] * key[0][1] * 4
+
+        while self._lru and (len(self._lru) > self._max_textures or self._bytes > self._max_bytes):
+            texture, key = self._lru.popitem(last=False)
+            self._idle[key].remove(texture)
+            if not self._idle[key]:
+                del self._idle[key]
+            self._bytes -= key[0][0] * key[0][1] * 4
+
+    def clear(self):
+        """
+        drop all idle textures
+        """
+        self._idle.clear()
+        self._lru.clear()
+        self._bytes = 0
+
+
+def pool_of(renderer: Renderer) -> TexturePool:
+    """
+    get the render target texture pool of `renderer`
+    """
+    pool = renderer._pool
+    if not pool:
+        pool = renderer._pool = TexturePool(renderer)
+    return pool
+
+def _sprite_quad(tw, th, region, dst_rect_or_coord, src_rect, angle, origin, flipX, flipY):
+    """
+    vertex positions and texture coordinates of a sprite of a `tw`x`th` texture
+    """
+    if src_rect:
+        sx, sy, sw, sh = src_rect
+        if region:
+            sx += region[0]
+            sy += region[1]
+    elif region:
+        sx, sy, sw, sh = region
+    else:
+        sx, sy, sw, sh = 0, 0, tw, th
+
+    u0, v0, u1, v1 = sx / tw, sy / th, (sx + sw) / tw, (sy + sh) / th
+    if flipX:
+        u0, u1 = u1, u0
+    if flipY:
+        v0, v1 = v1, v0
+
+    if len(dst_rect_or_coord) == 2:
+        x0, y0 = dst_rect_or_coord
+        dw, dh = sw, sh
+    else:
+        x0, y0, dw, dh = dst_rect_or_coord
+    x1, y1 = x0 + dw, y0 + dh
+
+    if angle:
+        ox, oy = origin if origin else (dw / 2, dh / 2)
+        ox, oy = x0 + ox, y0 + oy
+        rad = math.radians(angle)
+        c, s = math.cos(rad), math.sin(rad)
+        xy = []
+        for x, y in ((x0, y0), (x1, y0), (x1, y1), (x0, y1)):
+            x, y = x - ox, y - oy
+            xy += (ox + c * x - s * y, oy + s * x + c * y)
+    else:
+        xy = (x0, y0, x1, y0, x1, y1, x0, y1)
+
+    return xy, (u0, v0, u1, v0, u1, v1, u0, v1)
+
+# vertex indices of quads, shared by all sprite batches
+_quad_indices = array('i')
+
+class SpriteBatch:
+    """
+    sprites of one texture kept across frames and drawn with a single SDL_RenderGeometry call
+
+    sprites are drawn in the order they are added, each as `Texture.blit_to_target` would except that a coord
+    destination is sized by the source rect
+
+    falls back to one `Texture.blit_to_target` per sprite where SDL or pygame does not allow geometry rendering
+    """
+    def __init__(self, texture: Texture):
+        self._texture = texture
+        self._sprites = list()
+        self._xy = array('f')
+        self._uv = array('f')
+        # texture coordinates were computed for this underlying texture and region, atlas regions may move
+        self._uv_of = (texture._texture, texture._rect)
+
+    def __len__(self):
+        return len(self._sprites)
+
+    @property
+    def texture(self):
+        return self._texture
+
+    def _quad(self, sprite):
+        _texture = self._texture._texture
+        return _sprite_quad(_texture.width, _texture.height, self._texture._rect, *sprite)
+
+    def add(self, dst_rect_or_coord, src_rect=None, angle=0, origin=None, flipX=False, flipY=False) -> int:
+        """
+        add a sprite, parameters are as of `Texture.blit_to_target`, return index of the sprite
+        """
+        sprite = (dst_rect_or_coord, src_rect, angle, origin, flipX, flipY)
+        xy, uv = self._quad(sprite)
+        self._sprites.append(sprite)
+        self._xy.extend(xy)
+        self._uv.extend(uv)
+        return len(self._sprites) - 1
+
+    def set(self, index, dst_rect_or_coord, src_rect=None, angle=0, origin=None, flipX=False, flipY=False):
+        """
+        replace sprite at `index`
+        """
+        sprite = (dst_rect_or_coord, src_rect, angle, origin, flipX, flipY)
+        xy, uv = self._quad(sprite)
+        self._sprites[index] = sprite
+        self._xy[index * 8:index * 8 + 8] = array('f', xy)
+        self._uv[index * 8:index * 8 + 8] = array('f', uv)
+
+    def remove(self, index):
+        """
+        remove sprite at `index`, sprites after it move down an index
+        """
+        del self._sprites[index]
+        del self._xy[index * 8:index * 8 + 8]
+        del self._uv[index * 8:index * 8 + 8]
+
+    def clear(self):
+        self._sprites.clear()
+        self._xy = array('f')
+        self._uv = array('f')
+
+    def draw(self):
+        """
+        draw all sprites to the rendering target
+        """
+        global _quad_indices
+        if not self._sprites:
+            return
+        texture = self._texture
+        _texture = texture._texture
+        renderer = texture._renderer
+        renderer.flush()
+
+        # SDL < 2.0.18 has no geometry rendering, SDL_Texture* is not known for all pygame versions
+        _ctype = pgtexture_sdl(_texture) if sdl_rendergeometryraw else None
+        if not _ctype:
+            for dst, src, angle, origin, flipX, flipY in self._sprites:
+                if len(dst) == 2:
+                    dst = (*dst, *(src[2:] if src else texture.size))
+                texture.blit_to_target(src, dst, angle, origin, flipX, flipY)
+            return
+
+        if self._uv_of != (_texture, texture._rect):
+            self._uv = array('f')
+            for sprite in self._sprites:
+                self._uv.extend(self._quad(sprite)[1])
+            self._uv_of = (_texture, texture._rect)
+
+        n = len(self._sprites) * 6
+        if len(_quad_indices) < n:
+            # grow ahead so that a growing batch does not rebuild the indices every frame
+            _quad_indices = array('i', (i * 4 + v for i in range(len(self._sprites) * 2) for v in (0, 1, 2, 0, 2, 3)))
+        color = array('B', (*_texture.color[:3], _texture.alpha))
+        sdl_rendergeometryraw(renderer._ctype, _ctype, self._xy, color, self._uv, _quad_indices, n)
+
+
 def _parse_font_entry_win(name, font, fonts):
     """
     Parse out a simpler name and the font style from the initial file name.
@@ -590,15 +1098,43 @@ def init():
 class InvalidLoopStateException(Exception):
     pass
 
+# posted by `_Runner.wakeup` to interrupt waiting for input, never dispatched
+_WAKEUP_EVENT = pygame.event.custom_type()
+
+def _loop_timeout(loop):
+    """
+    seconds until `loop` has a callback to run, inf if nothing is scheduled or None if it cannot be told
+
+    peeks into the internals of the asyncio event loop implementations, other loops return None
+    """
+    ready = getattr(loop, '_ready', None)
+    scheduled = getattr(loop, '_scheduled', None)
+    if ready is None or scheduled is None:
+        return None
+    if ready:
+        return 0
+    if not scheduled:
+        return math.inf
+    return max(scheduled[0].when() - loop.time(), 0)
+
 class _Runner(EventDispatcher):
     running = False
     mouses = None
     current_renderer = None
     tasks_set = set()
     cleanup_coro = list()
+    # window events whose consecutive pygame events are merged before dispatching,
+    # see set_event_coalescing
+    coalesced_events = set()
     GARBAGE_CLEANUP_PERIOD = 60
+    # time (in seconds) to wait for input when the event loop cannot tell when its next callback is due
+    IDLE_POLL_PERIOD = 1/250
+    # longest time (in seconds) to block in SDL, bounds the latency of asyncio I/O which SDL cannot wait on
+    MAX_INPUT_WAIT = 1/4
 
     _stop_event = None
+    _loop = None
+    _loop_write_to_self = None
 
     def __init__(self):
         pass
@@ -613,9 +1149,49 @@ class _Runner(EventDispatcher):
         if self.running:
             self.running = False
             self._stop_event.set()
+            for window in _Windows:
+                window._wake_draw_schedule()
+            self.wakeup()
         else:
             raise InvalidLoopStateException()
 
+    def wakeup(self):
+        """
+        wake the event loop up from waiting for input, can be called from any thread
+        """
+        if self._loop:
+            pygame.event.post(pygame.event.Event(_WAKEUP_EVENT))
+
+    def _hook_loop_wakeup(self, loop):
+        """
+        make `loop.call_soon_threadsafe` also wake the runner up from waiting for input
+        """
+        write_to_self = getattr(loop, '_write_to_self', None)
+        if write_to_self is None:
+            return
+        def _write_to_self():
+            write_to_self()
+            self.wakeup()
+        loop._write_to_self = _write_to_self
+        self._loop_write_to_self = write_to_self
+
+    def _unhook_loop_wakeup(self, loop):
+        if self._loop_write_to_self is not None:
+            del loop._write_to_self
+            self._loop_write_to_self = None
+
+    async def _wait_for_input(self):
+        """
+        let other tasks run, then block in SDL until there is an event in the queue or the event loop has
+        a callback due (e.g. a window's next frame), so that an idle window sleeps instead of polling
+        """
+        await asyncio.sleep(0)
+        timeout = _loop_timeout(self._loop)
+        if timeout is None:
+            timeout = self.IDLE_POLL_PERIOD
+        timeout = min(timeout, self.MAX_INPUT_WAIT)
+        sdl_waiteventtimeout(math.ceil(timeout * 1000))
+
     async def run_one_event(self, event):
         _window = getattr(event, 'window', None)
         if _window:
@@ -624,94 +1200,9 @@ class _Runner(EventDispatcher):
         else:
             window = None
 
-        # TODO: LoOkUp FuNcTiOnS!?!
-        if event.type == pygame.QUIT:
-            self.running = False
-            return
-        elif event.type == pygame.KEYDOWN:
-            try:
-                key = Keys(event.key)
-            except ValueError:
-                key = event.key
-            try:
-                mod = Keys(event.mod)
-            except ValueError:
-                mod = event.mod
-            await window.dispatch_async('on_key_press', key, mod)
-        elif event.type == pygame.KEYUP:
-            try:
-                key = Keys(event.key)
-            except ValueError:
-                key = event.key
-            try:
-                mod = Keys(event.mod)
-            except ValueError:
-                mod = event.mod
-            await window.dispatch_async('on_key_release', key, mod)
-        elif event.type == pygame.MOUSEMOTION:
-            self.mouses = _mouse._mouse_from_pygtpl(event.buttons)
-            if self.mouses != _mouse.NButton:
-                await window.dispatch_async('on_mouse_drag', *event.pos, *event.rel, self.mouses)
-            else:
-                await window.dispatch_async('on_mouse_motion', *event.pos, *event.rel)
-        elif event.type == pygame.MOUSEBUTTONUP:
-            if event.button == pygame.BUTTON_WHEELDOWN or event.button == pygame.BUTTON_WHEELUP:
-                return
-            button = _mouse._mouse_from_pyg(event.button)
-            self.mouses &= ~button
-            last = False
-            if self.mouses == _mouse.NButton:
-                sdl_capturemouse(False)
-                last = True
-            await window.dispatch_async('on_mouse_release', *event.pos, button, pygame.key.get_mods(), last=last)
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            if event.button == pygame.BUTTON_WHEELDOWN or event.button == pygame.BUTTON_WHEELUP:
-                return
-            button = _mouse._mouse_from_pyg(event.button)
-            first = False
-            if self.mouses == _mouse.NButton:
-                sdl_capturemouse(True)
-                first = True
-            self.mouses |= button
-            await window.dispatch_async('on_mouse_press', *event.pos, button, pygame.key.get_mods(), first=first)
-        elif event.type == pygame.MOUSEWHEEL:
-            if event.flipped:
-                dx = -event.x
-                dy = -event.y
-            else:
-                dx = event.x
-                dy = event.y
-
-            await window.dispatch_async('on_mouse_scroll', *pygame.mouse.get_pos(), dx, dy)
-        
-        elif event.type == pygame.WINDOWCLOSE:
-            await window.dispatch_async('on_close')
-        elif event.type == pygame.WINDOWENTER:
-            await window.dispatch_async('on_mouse_enter')
-        elif event.type == pygame.WINDOWLEAVE:
-            await window.dispatch_async('on_mouse_leave')
-        elif event.type == pygame.WINDOWHIDDEN:
-            await window.dispatch_async('on_hide')
-        elif event.type == pygame.WINDOWMOVED:
-            await window.dispatch_async('on_move', -1, -1)
-        elif event.type == pygame.WINDOWRESIZED:
-            await window.dispatch_async('on_resize', -1, -1)
-        elif event.type == pygame.WINDOWSHOWN:
-            await window.dispatch_async('on_show', -1, -1)
-        elif event.type == pygame.WINDOWMINIMIZED:
-            await window.dispatch_async('on_minimized')
-        elif event.type == pygame.WINDOWMAXIMIZED:
-            await window.dispatch_async('on_maximized')
-        elif event.type == pygame.WINDOWRESTORED:
-            await window.dispatch_async('on_restored')
-        elif event.type == pygame.WINDOWFOCUSGAINED:
-            await window.dispatch_async('on_gain_focus')
-        elif event.type == pygame.WINDOWFOCUSLOST:
-            await window.dispatch_async('on_lost_focus')
-        elif event.type == pygame.WINDOWTAKEFOCUS:
-            await window.dispatch_async('on_offered_focus')
-        elif event.type == pygame.WINDOWHITTEST:
-            await window.dispatch_async('on_hit_test')
+        translator = _event_translators.get(event.type, None)
+        if translator:
+            await translator(self, window, event)
 
     async def run_events(self):
         def _immediate_event(userdata, event: ctypes.POINTER(SDL_Event)):
@@ -732,20 +1223,13 @@ class _Runner(EventDispatcher):
         pygame.event.clear()
         _mouse._mouse_from_pygtpl(pygame.mouse.get_pressed(5))
 
-        current_loop_time = None
-        loop_run_time = datetime.timedelta()
-
         while self.running:
-            current_start_time = time.perf_counter()
-            if not current_loop_time or any(not w._target_fps for w in _Windows):
-                await asyncio.sleep(0)
-            else:
-                target_time = datetime.timedelta(seconds=1) / max(w._target_fps for w in _Windows)
-                expect_time = datetime.timedelta(seconds=current_start_time - current_loop_time) + loop_run_time
-                await asyncio.sleep((target_time-expect_time).total_seconds()/2)
+            await self._wait_for_input()
 
             events = pygame.event.get(pump=False)
-            filtered_events = [e for e in events if e.type != pygame.SYSWMEVENT]
+            filtered_events = [e for e in events if e.type not in (pygame.SYSWMEVENT, _WAKEUP_EVENT)]
+            if self.coalesced_events:
+                filtered_events = _coalesce_events(filtered_events, self.coalesced_events)
             for event in filtered_events:
                 if not self.running:
                     return
@@ -754,13 +1238,6 @@ class _Runner(EventDispatcher):
                 except Exception:
                     print('Exception while dispatching event', event)
                     print(traceback.format_exc())
-            
-            current_loop_time = time.perf_counter()
-            loop_run_time = datetime.timedelta(seconds=current_loop_time - current_start_time)
-            pygame.event.pump()
-            
-            # TODO: if not in "hog cpu" context (another thing to do) then yield to other process
-            # until before next frame is needed, then we just await asyncio.sleep(0) at the start of this loop
 
         sdl_deleventwatch(event_filt, None)
 
@@ -781,6 +1258,8 @@ class _Runner(EventDispatcher):
 
     async def run_all(self):
         self._stop_event = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        self._hook_loop_wakeup(self._loop)
 
         for window in _Windows:
             self.tasks_set.add(asyncio.create_task(window.draw_schedule()))
@@ -791,10 +1270,129 @@ class _Runner(EventDispatcher):
         await self._stop_event.wait()
         for event in self.tasks_set:
             await event
+        self._unhook_loop_wakeup(self._loop)
+        self._loop = None
 
     def cleanup_coro_done(self, coro):
         self.cleanup_coro.append(coro)
 
+async def _translate_quit(runner: _Runner, window, event):
+    runner.running = False
+
+async def _translate_key_press(runner: _Runner, window, event):
+    await window.dispatch_async('on_key_press', _key_from_pyg(event.key), _key_from_pyg(event.mod))
+
+async def _translate_key_release(runner: _Runner, window, event):
+    await window.dispatch_async('on_key_release', _key_from_pyg(event.key), _key_from_pyg(event.mod))
+
+async def _translate_mouse_motion(runner: _Runner, window, event):
+    runner.mouses = _mouse._mouse_from_pygtpl(event.buttons)
+    if runner.mouses != _mouse.NButton:
+        await window.dispatch_async('on_mouse_drag', *event.pos, *event.rel, runner.mouses)
+    else:
+        await window.dispatch_async('on_mouse_motion', *event.pos, *event.rel)
+
+async def _translate_mouse_release(runner: _Runner, window, event):
+    if event.button == pygame.BUTTON_WHEELDOWN or event.button == pygame.BUTTON_WHEELUP:
+        return
+    button = _mouse._mouse_from_pyg(event.button)
+    runner.mouses &= ~button
+    last = False
+    if runner.mouses == _mouse.NButton:
+        sdl_capturemouse(False)
+        last = True
+    await window.dispatch_async('on_mouse_release', *event.pos, button, pygame.key.get_mods(), last=last)
+
+async def _translate_mouse_press(runner: _Runner, window, event):
+    if event.button == pygame.BUTTON_WHEELDOWN or event.button == pygame.BUTTON_WHEELUP:
+        return
+    button = _mouse._mouse_from_pyg(event.button)
+    first = False
+    if runner.mouses == _mouse.NButton:
+        sdl_capturemouse(True)
+        first = True
+    runner.mouses |= button
+    await window.dispatch_async('on_mouse_press', *event.pos, button, pygame.key.get_mods(), first=first)
+
+async def _translate_mouse_wheel(runner: _Runner, window, event):
+    if event.flipped:
+        dx = -event.x
+        dy = -event.y
+    else:
+        dx = event.x
+        dy = event.y
+
+    await window.dispatch_async('on_mouse_scroll', *pygame.mouse.get_pos(), dx, dy)
+
+def _window_event_translator(name, *args):
+    async def _translate_window_event(runner: _Runner, window, event):
+        await window.dispatch_async(name, *args)
+    return _translate_window_event
+
+# pygame event type -> coroutine function translating the event into window event(s)
+_event_translators = {
+    pygame.QUIT: _translate_quit,
+    pygame.KEYDOWN: _translate_key_press,
+    pygame.KEYUP: _translate_key_release,
+    pygame.MOUSEMOTION: _translate_mouse_motion,
+    pygame.MOUSEBUTTONUP: _translate_mouse_release,
+    pygame.MOUSEBUTTONDOWN: _translate_mouse_press,
+    pygame.MOUSEWHEEL: _translate_mouse_wheel,
+    pygame.WINDOWCLOSE: _window_event_translator('on_close'),
+    pygame.WINDOWENTER: _window_event_translator('on_mouse_enter'),
+    pygame.WINDOWLEAVE: _window_event_translator('on_mouse_leave'),
+    pygame.WINDOWHIDDEN: _window_event_translator('on_hide'),
+    pygame.WINDOWMOVED: _window_event_translator('on_move', -1, -1),
+    pygame.WINDOWRESIZED: _window_event_translator('on_resize', -1, -1),
+    pygame.WINDOWSHOWN: _window_event_translator('on_show', -1, -1),
+    pygame.WINDOWEXPOSED: _window_event_translator('on_expose'),
+    pygame.WINDOWMINIMIZED: _window_event_translator('on_minimized'),
+    pygame.WINDOWMAXIMIZED: _window_event_translator('on_maximized'),
+    pygame.WINDOWRESTORED: _window_event_translator('on_restored'),
+    pygame.WINDOWFOCUSGAINED: _window_event_translator('on_gain_focus'),
+    pygame.WINDOWFOCUSLOST: _window_event_translator('on_lost_focus'),
+    pygame.WINDOWTAKEFOCUS: _window_event_translator('on_offered_focus'),
+    pygame.WINDOWHITTEST: _window_event_translator('on_hit_test'),
+}
+
+def _coalescing_key(event, coalesced):
+    """
+    return key which consecutive events with the same key can be merged, None if event cannot be merged
+    """
+    if event.type == pygame.MOUSEMOTION:
+        name = 'on_mouse_drag' if any(event.buttons) else 'on_mouse_motion'
+        if name in coalesced:
+            return (event.type, getattr(event, 'window', None), tuple(event.buttons))
+    elif event.type == pygame.MOUSEWHEEL:
+        if 'on_mouse_scroll' in coalesced:
+            return (event.type, getattr(event, 'window', None), event.flipped)
+    return None
+
+def _merge_events(prev, event):
+    attrs = dict(event.dict)
+    if event.type == pygame.MOUSEMOTION:
+        attrs['rel'] = (prev.rel[0] + event.rel[0], prev.rel[1] + event.rel[1])
+    else: # event.type == pygame.MOUSEWHEEL
+        for k in ('x', 'y', 'precise_x', 'precise_y'):
+            if k in attrs:
+                attrs[k] = getattr(prev, k, 0) + attrs[k]
+    return pygame.event.Event(event.type, attrs)
+
+def _coalesce_events(events, coalesced):
+    """
+    merge consecutive mouse motion, drag and wheel events of the same window
+    """
+    res = []
+    prev_key = None
+    for event in events:
+        key = _coalescing_key(event, coalesced)
+        if key is not None and key == prev_key:
+            res[-1] = _merge_events(res[-1], event)
+        else:
+            res.append(event)
+        prev_key = key
+    return res
+
 runner = _Runner()
 
 def run():
@@ -803,6 +1401,24 @@ def run():
 def stop():
     runner.stop()
 
+def set_event_coalescing(event, enabled=True):
+    """
+    merge consecutive input events of the same window received in a frame before dispatching
+    
+    parameters:
+        event: str
+            one of 'on_mouse_motion', 'on_mouse_drag' (relative motion is summed)
+            or 'on_mouse_scroll' (scroll deltas are summed)
+        [enabled]
+            whether to coalesce the event, apps needing every sample should leave it disabled (default)
+    """
+    if event not in ('on_mouse_motion', 'on_mouse_drag', 'on_mouse_scroll'):
+        raise ValueError('event `{}` cannot be coalesced'.format(event))
+    if enabled:
+        runner.coalesced_events.add(event)
+    else:
+        runner.coalesced_events.discard(event)
+
 def uninit():
     if runner.running:
         stop()
@@ -18,19 +18,16 @@ class BasicShapeProperties:
 class Point(BasicShapeProperties):
     def draw(self, point):
         rdr = current_renderer()
-        with rdr.draw_color(self._col):
-            rdr.draw_point(point)
+        rdr.draw_point(point, self._col)
 
 
 class Line(BasicShapeProperties):
     def draw(self, point, point2):
         rdr = current_renderer()
-        with rdr.draw_color(self._col):
-            rdr.draw_line(point, point2)
+        rdr.draw_line(point, point2, self._col)
 
 
 class Rectangle(BasicShapeProperties):
     def draw(self, point, size):
         rdr = current_renderer()
-        with rdr.draw_color(self._col):
-            rdr.fill_rect((*point, *size))
+        rdr.fill_rect((*point, *size), self._col)
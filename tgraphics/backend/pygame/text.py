@@ -5,7 +5,8 @@ from pygame.freetype import Font, SysFont
 from string import printable
 from typing import Optional, Union
 
-from .pygame import current_renderer, Surface, Texture
+from .atlas import atlas_of
+from .pygame import current_renderer, Surface
 
 MAX_LINEAR_SCALEUP = 1.5
 
@@ -87,8 +88,8 @@ class Label:
             self._gen_surface(height)
 
         rdr = current_renderer()
-        if rdr not in self._texttext or (height and self._texttext[rdr][1][1] * MAX_LINEAR_SCALEUP < height):
-            self._texttext[rdr] = (Texture.from_surface(rdr, self._textsurface), self._c_off, self._c_size[1])
+        if rdr not in self._texttext or (height and self._texttext[rdr][2] * MAX_LINEAR_SCALEUP < height):
+            self._texttext[rdr] = (atlas_of(rdr).texture_from_surface(self._textsurface), self._c_off, self._c_size[1])
 
         height = height if height else self._size[1]
         textinfo = self._texttext[rdr]
@@ -111,14 +111,35 @@ class Window:
     def fps(self, fps):
         self._window.fps = fps
 
+    @property
+    def render_mode(self):
+        """
+        'per_frame' (default) renders every frame, 'on_demand' only renders after target element is invalidated,
+        'partial' only redraws regions damaged by the invalidation
+        """
+        return self._window.render_mode
+
+    @render_mode.setter
+    def render_mode(self, mode):
+        self._window.render_mode = mode
+
+    def _on_target_invalidate(self, element, rect=None):
+        self._window.invalidate(rect)
+        return True
+
     @property
     def target_element(self):
         return _WindowsBoundedElement[self]
 
     @target_element.setter
     def target_element(self, element):
+        prev = _WindowsBoundedElement[self]
+        if prev:
+            prev.event['on_invalidate'].remove_listener(self._on_target_invalidate)
         _WindowsBoundedElement[self] = element
+        self._window.invalidate()
         if element:
+            element.event['on_invalidate'].add_listener(self._on_target_invalidate, weak=True)
             self._window.event('on_draw')(partial(self._on_draw, element))
             self._window.target = element
         else:
@@ -16,6 +16,21 @@ class ElementABC(EventDispatcherABC):
     @event_handler
     def on_element_dropped(self, x, y, element: 'ElementABC'):
         raise DropNotSupportedError(self)
+
+    @event_handler
+    def on_invalidate(self, element: 'ElementABC', rect=None):
+        # listeners (parents) have already been notified, do not fall through to target
+        return True
+
+    def invalidate(self, rect=None):
+        """
+        notify parents (and eventually the window) that render result of this element has changed
+
+        parameters:
+            [rect]
+                changed region (x, y, w, h) relative to the element, the whole element if unspecified
+        """
+        self.dispatch('on_invalidate', self, rect)
         
     @property
     @abstractmethod
@@ -34,9 +49,13 @@ class ElementABC(EventDispatcherABC):
         return self._static
 
     def texture(self, size=None):
+        """
+        render result of this element as a texture, which may be a temporary one from the renderer's texture pool
+        that the caller should `release` (or use as a context manager) when done with it
+        """
         _back = _current_backend()
         _rdr = _back.current_renderer()
-        _tex = _back.Texture.create_as_target(_rdr, size if size else self.size, blend=_current_backend().BlendMode.BLENDMODE_BLEND)
+        _tex = _back.pool_of(_rdr).acquire(size if size else self.size, blend=_back.BlendMode.BLENDMODE_BLEND)
         with _rdr.target(_tex):
             self.render((0, 0), size)
         return _tex
@@ -1,11 +1,12 @@
 import asyncio
 from abc import ABCMeta
-from collections import defaultdict
 from functools import partial
 import inspect
+import sys
 import traceback
 from types import MethodType
 import warnings
+from weakref import ref, WeakMethod
 
 from ..core.backend_loader import _current_backend
 from ..utils.typehint import *
@@ -41,34 +42,55 @@ class AsyncFromSyncWarning(UserWarning):
 
 warnings.simplefilter('always', AsyncFromSyncWarning)
 
+# production mode, set to False (or run python with -O) to skip the call site lookup entirely
+WARN_ASYNC_FROM_SYNC = __debug__
+
+_warned_call_sites = set()
+
+def set_warn_async_from_sync(enabled: bool) -> None:
+    global WARN_ASYNC_FROM_SYNC
+    WARN_ASYNC_FROM_SYNC = enabled
+
 def _warn_async_from_sync(f, event, obj):
-    stack = inspect.stack()
-    frame = next((f for f in stack if f.filename != __file__), None)
+    if not WARN_ASYNC_FROM_SYNC:
+        return
+
+    frame = sys._getframe(1)
     try:
-        warnings.warn_explicit(
-            AsyncFromSyncWarning(
-                '\n'.join((
-                    'dispatching async event function from sync dispatch, consider using dispatch_async instead of dispatch',
-                    'function: {}'.format(f),
-                    'event: {}'.format(event),
-                    'object: {}'.format(obj),
-                ))
-            ),
-            None,
-            filename=frame.filename if frame else None, 
-            lineno=frame.lineno if frame else None
-        )
+        while frame and frame.f_code.co_filename == __file__:
+            frame = frame.f_back
+        call_site = (frame.f_code.co_filename, frame.f_lineno) if frame else ('<unknown>', 0)
     finally:
-        if frame:
-            del frame
-        del stack
+        del frame
+
+    if call_site in _warned_call_sites:
+        return
+    _warned_call_sites.add(call_site)
+
+    warnings.warn_explicit(
+        AsyncFromSyncWarning(
+            '\n'.join((
+                'dispatching async event function from sync dispatch, consider using dispatch_async instead of dispatch',
+                'function: {}'.format(f),
+                'event: {}'.format(event),
+                'object: {}'.format(obj),
+            ))
+        ),
+        None,
+        filename=call_site[0], 
+        lineno=call_site[1]
+    )
+
+def _report_exception(_event, _listener):
+    # TODO: debug mode
+    print('Exception while dispatching event{}'.format(' listener' if _listener else ''), _event)
+    print(traceback.format_exc())
 
 def _invoke(f, *args, _event, _obj, _listener=False, **kwargs):
     try:
         res = f(*args, **kwargs)
     except Exception as e:
-        print('Exception while dispatching event{}'.format(' listener' if _listener else ''), _event)
-        print(traceback.format_exc())
+        _report_exception(_event, _listener)
         return False
 
     if inspect.isawaitable(res):
@@ -83,16 +105,68 @@ async def _invoke_async(f, *args, _event, _obj, _listener=False, **kwargs):
     try:
         return await invoke(f, *args, **kwargs)
     except Exception as e:
-        # TODO: debug mode
-        print('Exception while dispatching event listener{}'.format(' listener' if _listener else ''), _event)
-        print(traceback.format_exc())
+        _report_exception(_event, _listener)
+        return False
+
+async def _await_invoked(res, *, _event, _listener=False):
+    try:
+        return await res
+    except Exception as e:
+        _report_exception(_event, _listener)
+        return False
+
+def _invoke_inline(f, *args, _event, _listener=False, **kwargs):
+    """
+    invoke non-coroutine function `f` from async dispatch without creating a coroutine,
+    might still return an awaitable if `f` returns one
+    """
+    try:
+        return f(*args, **kwargs)
+    except Exception as e:
+        _report_exception(_event, _listener)
         return False
 
+class _WeakListener:
+    """
+    listener wrapper that only keeps a weak reference to the listener, does nothing after the listener is collected
+    """
+    def __init__(self, listener, callback):
+        self._ref = WeakMethod(listener, callback) if isinstance(listener, MethodType) else ref(listener, callback)
+        self.is_coroutine = inspect.iscoroutinefunction(listener)
+
+    def __call__(self, *args, **kwargs):
+        listener = self._ref()
+        if listener is None:
+            return False
+        return listener(*args, **kwargs)
+
+    def __eq__(self, other):
+        if isinstance(other, _WeakListener):
+            return self is other
+        listener = self._ref()
+        return listener is not None and listener == other
+
+    __hash__ = object.__hash__
+
+    def __repr__(self):
+        return '<weak listener {}>'.format(self._ref())
+
+
+def _is_coroutine_listener(f):
+    if isinstance(f, _WeakListener):
+        return f.is_coroutine
+    return inspect.iscoroutinefunction(f)
+
 class EventLookupHelper:
     def __init__(self, dispatcher):
         self._obj = dispatcher
-        self._handlers = defaultdict(lambda: defaultdict(lambda: None))
-        self._listeners = defaultdict(lambda: defaultdict(list))
+        # per-instance handler overrides, class handlers are looked up from `_class_handlers` of the anchors
+        self._handlers = dict()
+        # listeners are stored as tuples and replaced on modification (copy-on-write)
+        self._listeners = dict()
+        # (anchor, event) -> (listeners, handler, fallthrough)
+        # listeners and handler are (function, is coroutine function) pairs
+        self._resolved = dict()
         self._target = None
 
     @property
@@ -103,28 +177,66 @@ class EventLookupHelper:
     def target(self, target):
         self._target = target
 
+    def invalidate(self):
+        """
+        drop all compiled resolutions, must be called whenever handlers or listeners are changed
+        """
+        self._resolved.clear()
+
+    def _resolve(self, anchor, event):
+        listeners = []
+        for cls in anchor.__mro__:
+            cls_listeners = self._listeners.get(cls, None)
+            if cls_listeners:
+                listeners.extend((f, _is_coroutine_listener(f)) for f in cls_listeners.get(event, ()))
+            handler = self._handler_of(cls, event)
+            if handler:
+                return (tuple(listeners), (handler, inspect.iscoroutinefunction(handler)), False)
+
+        return (tuple(listeners), None, True)
+
+    def _prune_listener(self, anchor, event, dead_ref):
+        anchor_listeners = self._listeners.get(anchor, None)
+        if not anchor_listeners or event not in anchor_listeners:
+            return
+        anchor_listeners[event] = tuple(f for f in anchor_listeners[event] if not (isinstance(f, _WeakListener) and f._ref is dead_ref))
+        self.invalidate()
+
+    def _handler_of(self, cls, event):
+        overrides = self._handlers.get(cls, None)
+        if overrides is not None and event in overrides:
+            return overrides[event]
+        func = cls.__dict__.get('_class_handlers', {}).get(event, None)
+        return MethodType(func, self._obj) if func else None
+
+    def resolve_from_anchor(self, anchor, event):
+        """
+        get (listeners, handler, fallthrough) that will be invoked when dispatching `event` from `anchor`
+        """
+        try:
+            return self._resolved[(anchor, event)]
+        except KeyError:
+            resolved = self._resolved[(anchor, event)] = self._resolve(anchor, event)
+            return resolved
+
     def handlers_from_anchor(self, anchor):
         _h = self._target.handlers if self._target is not None else set()
-        e_f_pair = ((e, f) for cls in anchor.__mro__ for e, f in self._handlers[cls].items())
-        return _h | {e for e, f in e_f_pair if f} | {e for e, ls in self._listeners.items() if ls}
+        e_cls_pair = ((e, cls) for cls in anchor.__mro__ for e in {*cls.__dict__.get('_class_handlers', ()), *self._handlers.get(cls, ())})
+        e_f_pair = ((e, self._handler_of(cls, e)) for e, cls in e_cls_pair)
+        e_ls_pair = ((e, ls) for cls in anchor.__mro__ for e, ls in self._listeners.get(cls, {}).items())
+        return _h | {e for e, f in e_f_pair if f} | {e for e, ls in e_ls_pair if ls}
 
     def proxy_from_anchor(self, anchor):
         return EventInstanceProxy(self, anchor)
 
     def dispatch_from_anchor(self, anchor, event, *args, **kwargs):
-        found = False
+        listeners, handler, fallthrough = self.resolve_from_anchor(anchor, event)
         res = False
-        for cls in anchor.__mro__:
-            listeners = self._listeners[cls].get(event, None)
-            if listeners:
-                inv_l = [_invoke(f, *args, _event=event, _obj=self._obj, _listener=True, **kwargs) for f in listeners.copy()]
-                res = any(inv_l) or res
-            handler = self._handlers[cls].get(event, None)
-            if handler:
-                found = True
-                res = _invoke(handler, *args, _event=event, _obj=self._obj, **kwargs)
-            if found:
-                return res
+        for f, _ in listeners:
+            if _invoke(f, *args, _event=event, _obj=self._obj, _listener=True, **kwargs):
+                res = True
+        if not fallthrough:
+            return _invoke(handler[0], *args, _event=event, _obj=self._obj, **kwargs)
 
         if self._target:
             return self._target.dispatch(event, *args, **kwargs) or res
@@ -132,19 +244,23 @@ class EventLookupHelper:
         return True
 
     async def dispatch_async_from_anchor(self, anchor, event, *args, **kwargs):
-        found = False
+        listeners, handler, fallthrough = self.resolve_from_anchor(anchor, event)
         res = False
-        for cls in anchor.__mro__:
-            listeners = self._listeners[cls].get(event, None)
-            if listeners:
-                inv_l = [await _invoke_async(f, *args, _event=event, _obj=self._obj, _listener=True, **kwargs) for f in listeners.copy()]
-                res = any(inv_l) or res
-            handler = self._handlers[cls].get(event, None)
-            if handler:
-                found = True
-                res = await _invoke_async(handler, *args, _event=event, _obj=self._obj, **kwargs)
-            if found:
-                return res
+        for f, is_coro in listeners:
+            if is_coro:
+                inv = await _invoke_async(f, *args, _event=event, _obj=self._obj, _listener=True, **kwargs)
+            else:
+                inv = _invoke_inline(f, *args, _event=event, _listener=True, **kwargs)
+                if inspect.isawaitable(inv):
+                    inv = await _await_invoked(inv, _event=event, _listener=True)
+            if inv:
+                res = True
+        if not fallthrough:
+            f, is_coro = handler
+            if is_coro:
+                return await _invoke_async(f, *args, _event=event, _obj=self._obj, **kwargs)
+            inv = _invoke_inline(f, *args, _event=event, **kwargs)
+            return (await _await_invoked(inv, _event=event)) if inspect.isawaitable(inv) else inv
 
         if self._target:
             return (await self._target.dispatch_async(event, *args, **kwargs)) or res
@@ -184,30 +300,45 @@ class EventTypeProxy:
         add event handler
         """
         proxy = self._instance_proxy
-        proxy._lookup._handlers[proxy._anchor][self._name] = func
+        proxy._lookup._handlers.setdefault(proxy._anchor, dict())[self._name] = func
+        proxy._lookup.invalidate()
         return proxy._lookup._obj
 
     @property
     def handler(self):
         proxy = self._instance_proxy
-        return proxy._lookup._handlers[proxy._anchor][self._name]
+        return proxy._lookup._handler_of(proxy._anchor, self._name)
 
     @handler.setter
     def handler(self, func):
         self(func)
 
-    def add_listener(self, listener):
+    def add_listener(self, listener, *, weak=False):
+        """
+        add event listener
+
+        if `weak` is True, only a weak reference (WeakMethod for bound methods) to the listener is kept
+        and the listener is removed automatically once it is garbage collected
+        """
         proxy = self._instance_proxy
-        proxy._lookup._listeners[proxy._anchor][self._name].append(listener)
+        if weak:
+            listener = _WeakListener(listener, partial(proxy._lookup._prune_listener, proxy._anchor, self._name))
+        anchor_listeners = proxy._lookup._listeners.setdefault(proxy._anchor, dict())
+        anchor_listeners[self._name] = (*anchor_listeners.get(self._name, ()), listener)
+        proxy._lookup.invalidate()
         return proxy._lookup._obj
 
     def remove_listener(self, listener):
         proxy = self._instance_proxy
+        anchor_listeners = proxy._lookup._listeners.get(proxy._anchor, {})
+        listeners = anchor_listeners.get(self._name, ())
         try:
-            proxy._lookup._listeners[proxy._anchor][self._name].remove(listener)
-            return proxy._lookup._obj
+            idx = listeners.index(listener)
         except ValueError:
             raise ListenerNotExistError(self._name, listener, proxy._lookup._obj) from None
+        anchor_listeners[self._name] = listeners[:idx] + listeners[idx+1:]
+        proxy._lookup.invalidate()
+        return proxy._lookup._obj
 
 
 class HandlersDescriptor:
@@ -249,6 +380,8 @@ class EventDispatcherMetaMixin:
     def __init__(self, name, bases, attrs):
         super().__init__(name, bases, attrs)
         self._instantiated_handlers = [e for e in attrs.values() if isinstance(e, EventHandler)]
+        # resolved once per class, bound to the instance on first dispatch
+        self._class_handlers = {e.event: e.func for e in self._instantiated_handlers}
         self.handlers = HandlersDescriptor(self)
         self.event = EventDescriptor(self)
         self.dispatch = DispatchDescriptor(self)
@@ -266,14 +399,10 @@ class EventDispatcherMetaMixin:
                     dispatch_async: Callable[..., Coroutine[None, None, bool]]
 
                     _instantiated_handlers: List[EventHandler]
+                    _class_handlers: Dict[str, Callable]
 
                     def __init__(self, *args, **kwargs):
                         self._lookup_helper = EventLookupHelper(self)
-                        for cls in type(self).__mro__:
-                            _handlers = getattr(cls, '_instantiated_handlers', None)
-                            if _handlers:
-                                for e in _handlers:
-                                    self._event(cls)[e.event](MethodType(e.func, self))
                         super().__init__(*args, **kwargs)
 
                     @property
@@ -293,8 +422,8 @@ class EventDispatcherMetaMixin:
                     def _dispatch(self, anchor, event, *args, **kwargs) -> bool:
                         return self._lookup_helper.dispatch_from_anchor(anchor, event, *args, **kwargs)
 
-                    async def _dispatch_async(self, anchor, event, *args, **kwargs) -> bool:
-                        return await self._lookup_helper.dispatch_async_from_anchor(anchor, event, *args, **kwargs)
+                    def _dispatch_async(self, anchor, event, *args, **kwargs) -> Coroutine[None, None, bool]:
+                        return self._lookup_helper.dispatch_async_from_anchor(anchor, event, *args, **kwargs)
 
                 return EventDispatcherCompositeBase
 
@@ -1,6 +1,8 @@
 from .mixin import *
 from .button import Button, ButtonBGDefault, ButtonState, ButtonType, LabelButton
 from .empty import Empty
-from .grid import Grid, StaticGrid, StaticGridError, StructuredGrid, StructuredStaticGrid, Subelement
+from .grid import CachedGrid, Grid, StaticGrid, StaticGridError, StructuredCachedGrid, StructuredGrid, StructuredStaticGrid, RenderCachePolicy, Subelement
 from .scrollbar import HorizontalScrollbar, VerticalScrollbar
+from .scrollview import ScrollView
+from .virtuallist import VirtualList
 from . import grid
@@ -76,42 +76,55 @@ class Button(ElementABC):
         self._hovering = False
         self._clicking = False
 
+    def _set_render_state(self, hovering=None, clicking=None):
+        changed = False
+        if hovering is not None and hovering != self._hovering:
+            self._hovering = hovering
+            changed = True
+        if clicking is not None and clicking != self._clicking:
+            self._clicking = clicking
+            changed = True
+        if changed:
+            self.invalidate()
+
     @event_handler
     def on_mouse_enter(self): # pylint: disable=unused-variable
-        self._hovering = True
+        self._set_render_state(hovering=True)
         return True
 
     @event_handler
     def on_mouse_leave(self): # pylint: disable=unused-variable
-        self._hovering = False
+        self._set_render_state(hovering=False)
         return True
 
     @event_handler
     def on_mouse_press(self, x, y, button, mods, first): # pylint: disable=unused-variable
         if button == _current_backend().mouse.MouseButton.LEFT:
-            self._clicking = True
+            self._set_render_state(clicking=True)
         return True
 
     @event_handler
     async def on_mouse_release(self, x, y, button, mods, last): # pylint: disable=unused-variable
         if button == _current_backend().mouse.MouseButton.LEFT:
-            self._clicking = False                
+            self._set_render_state(clicking=False)
             if last:
                 if self._type == ButtonType.DISABLE:
                     return True
                 if 0 > x or 0 > y or x > self._sz[0] or y > self._sz[1]:
-                    self._hovering = False
+                    self._set_render_state(hovering=False)
                 elif self._type == ButtonType.TOGGLE:
                     if self._state == ButtonState.OFF:
                         self._state = ButtonState.ON
+                        self.invalidate()
                         await self.dispatch_async('on_button_on')
                     else:
                         self._state = ButtonState.OFF
+                        self.invalidate()
                         await self.dispatch_async('on_button_off')
                 else:
                     await self.dispatch_async('on_button_press')
         elif last:
-            self._clicking = False 
+            self._set_render_state(clicking=False)
         return True
 
     @property
@@ -129,6 +142,7 @@ class Button(ElementABC):
             self._state = ButtonState.DISABLED
         elif type == ButtonType.DEFAULT:
             self._state = ButtonState.OFF
+        self.invalidate()
 
     def render(self, location, size=None):
         if self._state == ButtonState.DISABLED:
@@ -1,6 +1,10 @@
 import asyncio
+import bisect
+from collections import OrderedDict
 from enum import auto, Enum
 import itertools
+import math
+import time
 from typing import NamedTuple, Optional, Union
 from pygame import Rect
 
@@ -12,11 +16,29 @@ from ...utils.typehint import *
 
 class Subelement:
     element: ElementABC
-    offset: Tuple[int, int]
+    _offset: Tuple[int, int]
 
     def __init__(self, element, offset):
         self.element = element
-        self.offset = offset
+        self._offset = offset
+        self._grid = None
+        self._z = None
+
+    @property
+    def offset(self):
+        return self._offset
+
+    @offset.setter
+    def offset(self, offset):
+        grid = self._grid
+        if grid is None:
+            self._offset = offset
+            return
+        # damage both where the element was and where it is now
+        grid._invalidate_sub(self)
+        self._offset = offset
+        grid._index.update(self)
+        grid._invalidate_sub(self)
 
     def __iter__(self):
         return iter((self.element, self.offset))
@@ -31,14 +53,292 @@ class Subelement:
 
     def __setitem__(self, value, item):
         if value == 0:
-            self.element = item
+            if self._grid is not None:
+                self._grid._replace_element(self, item)
+            else:
+                self.element = item
         elif value == 1:
             self.offset = item
         else:
             raise IndexError('index out of range')
 
+def _z_key(sub: Subelement):
+    return sub._z
+
+def _intersect_rect(rect, other):
+    """
+    intersection of two (x, y, w, h) rects, other being None means unbounded, None if empty
+    """
+    if other is None:
+        return rect if rect[2] > 0 and rect[3] > 0 else None
+    x0, y0 = max(rect[0], other[0]), max(rect[1], other[1])
+    x1, y1 = min(rect[0] + rect[2], other[0] + other[2]), min(rect[1] + rect[3], other[1] + other[3])
+    if x1 <= x0 or y1 <= y0:
+        return None
+    return (x0, y0, x1 - x0, y1 - y0)
+
+class _SpatialIndex:
+    """
+    uniform bucket grid over subelements of a grid keyed on their offset and size
+
+    subelements spanning too many buckets are kept aside and always tested
+    """
+    BUCKET_SIZE = 128
+    MAX_BUCKETS = 64
+
+    def __init__(self):
+        self._buckets = dict()
+        self._large = set()
+        self._keys = dict()
+
+    def _span(self, sub: Subelement):
+        x, y = sub.offset
+        w, h = sub.element.size
+        _b = self.BUCKET_SIZE
+        return (math.floor(x / _b), math.floor(y / _b), math.floor((x + w) / _b), math.floor((y + h) / _b))
+
+    def add(self, sub: Subelement):
+        span = self._span(sub)
+        self._keys[sub] = span
+        x0, y0, x1, y1 = span
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > self.MAX_BUCKETS:
+            self._large.add(sub)
+            return
+        for bx in range(x0, x1 + 1):
+            for by in range(y0, y1 + 1):
+                self._buckets.setdefault((bx, by), set()).add(sub)
+
+    def remove(self, sub: Subelement):
+        span = self._keys.pop(sub, None)
+        if span is None:
+            return
+        if sub in self._large:
+            self._large.discard(sub)
+            return
+        x0, y0, x1, y1 = span
+        for bx in range(x0, x1 + 1):
+            for by in range(y0, y1 + 1):
+                bucket = self._buckets[(bx, by)]
+                bucket.discard(sub)
+                if not bucket:
+                    del self._buckets[(bx, by)]
+
+    def update(self, sub: Subelement):
+        if sub in self._keys and self._keys[sub] != self._span(sub):
+            self.remove(sub)
+            self.add(sub)
+
+    def query(self, x0, y0, x1, y1) -> Optional[Set[Subelement]]:
+        """
+        get subelements whose indexed area may intersect the rect (unordered),
+        None if the rect spans more buckets than it is worth looking up
+        """
+        _b = self.BUCKET_SIZE
+        bx0, by0, bx1, by1 = math.floor(x0 / _b), math.floor(y0 / _b), math.floor(x1 / _b), math.floor(y1 / _b)
+        if (bx1 - bx0 + 1) * (by1 - by0 + 1) > len(self._keys):
+            return None
+        found = set(self._large)
+        for bx in range(bx0, bx1 + 1):
+            for by in range(by0, by1 + 1):
+                bucket = self._buckets.get((bx, by))
+                if bucket:
+                    found |= bucket
+        return found
+
+    def clear(self):
+        self._buckets.clear()
+        self._large.clear()
+        self._keys.clear()
+
+    def candidates(self, x, y):
+        """
+        get subelements whose indexed area may contain x, y (unordered)
+        """
+        _b = self.BUCKET_SIZE
+        bucket = self._buckets.get((math.floor(x / _b), math.floor(y / _b)))
+        if bucket:
+            return bucket | self._large if self._large else bucket
+        return self._large
+
+class _ZOrder:
+    """
+    subelements of a grid from bottom to top
+
+    each subelement carries a sortable z key, kept in a sorted list alongside the subelements, so that a subelement
+    is found by bisecting the keys and inserting one leaves the keys of the others untouched
+    """
+    def __init__(self):
+        self._keys = list()
+        self._subs = list()
+
+    def __len__(self):
+        return len(self._subs)
+
+    def __iter__(self):
+        return iter(self._subs)
+
+    def __reversed__(self):
+        return reversed(self._subs)
+
+    def top(self) -> Subelement:
+        return self._subs[-1]
+
+    def bottom(self) -> Subelement:
+        return self._subs[0]
+
+    def at(self, index) -> Subelement:
+        return self._subs[index]
+
+    def index(self, sub: Subelement):
+        i = bisect.bisect_left(self._keys, sub._z) if sub._z is not None else len(self._keys)
+        if i == len(self._keys) or self._subs[i] is not sub:
+            raise ValueError('subelement is not in grid')
+        return i
+
+    def append(self, sub: Subelement):
+        sub._z = self._keys[-1] + 1 if self._keys else 0
+        self._keys.append(sub._z)
+        self._subs.append(sub)
+
+    def prepend(self, sub: Subelement):
+        sub._z = self._keys[0] - 1 if self._keys else 0
+        self._keys.insert(0, sub._z)
+        self._subs.insert(0, sub)
+
+    def insert(self, index, sub: Subelement):
+        if index < 0:
+            index = max(0, index + len(self._subs))
+        if index >= len(self._subs):
+            return self.append(sub)
+        if index == 0:
+            return self.prepend(sub)
+        _z = (self._keys[index - 1] + self._keys[index]) / 2
+        if _z in (self._keys[index - 1], self._keys[index]):
+            # floats between the neighbours ran out
+            self._renumber()
+            _z = index - 0.5
+        sub._z = _z
+        self._keys.insert(index, _z)
+        self._subs.insert(index, sub)
+
+    def remove(self, sub: Subelement):
+        i = self.index(sub)
+        del self._keys[i]
+        del self._subs[i]
+
+    def move_top(self, sub: Subelement):
+        if sub is not self.top():
+            self.remove(sub)
+            self.append(sub)
+
+    def move_bottom(self, sub: Subelement):
+        if sub is not self.bottom():
+            self.remove(sub)
+            self.prepend(sub)
+
+    def clear(self):
+        self._keys.clear()
+        self._subs.clear()
+
+    def _renumber(self):
+        for i, sub in enumerate(self._subs):
+            sub._z = i
+        self._keys = list(range(len(self._subs)))
+
+class RenderCachePolicy:
+    """
+    opt-in policy for grids to cache render result of children that are expensive to render and rarely change
+
+    parameters:
+        [min_frames]
+            number of renders a child has to stay unchanged for before being cached
+        [min_cost]
+            average render time (in seconds) a child has to take before being cached
+        [budget]
+            total area (in pixels) of cached textures, least recently drawn children are uncached when exceeded
+
+    a policy can be shared between grids, in which case they also share the budget
+    """
+    def __init__(self, min_frames=30, min_cost=0.0005, budget=4096*4096):
+        self.min_frames = min_frames
+        self.min_cost = min_cost
+        self.budget = budget
+        self._used = 0
+        self._cached = OrderedDict()
+
+    def _should_cache(self, state: '_ChildRenderState'):
+        return state.frames >= self.min_frames and state.cost >= self.min_cost
+
+    def _reserve(self, state: '_ChildRenderState', area):
+        if area > self.budget:
+            return False
+        while self._used + area > self.budget:
+            # account for the evicted entry here, it is no longer in `_cached` when `reset` releases it
+            _state, _area = self._cached.popitem(last=False)
+            self._used -= _area
+            _state.reset()
+        self._cached[state] = area
+        self._used += area
+        return True
+
+    def _release(self, state: '_ChildRenderState'):
+        self._used -= self._cached.pop(state, 0)
+
+    def _touch(self, state: '_ChildRenderState'):
+        self._cached.move_to_end(state)
+
+class _ChildRenderState:
+    """
+    render statistics and cached texture of a child of a grid with a render cache policy
+    """
+    def __init__(self, policy: RenderCachePolicy):
+        self.policy = policy
+        self.frames = 0
+        self.cost = None
+        self.texture = None
+        self.size = None
+
+    def render(self, element: ElementABC, location, size=None):
+        _size = (round(size[0]), round(size[1])) if size else None
+        if self.texture:
+            if _size == self.size:
+                self.policy._touch(self)
+                self.texture.draw(location)
+                return
+            self.reset()
+
+        _start = time.perf_counter()
+        element.render(location, size)
+        _cost = time.perf_counter() - _start
+        self.cost = _cost if self.cost is None else 0.75 * self.cost + 0.25 * _cost
+        self.frames += 1
+        if self.policy._should_cache(self):
+            self.cache(element, _size)
+
+    def cache(self, element: ElementABC, size):
+        _tex_size = size if size else tuple(round(v) for v in element.size)
+        if _tex_size[0] <= 0 or _tex_size[1] <= 0 or not self.policy._reserve(self, _tex_size[0] * _tex_size[1]):
+            return
+        _back = _current_backend()
+        _renderer = _back.current_renderer()
+        self.texture = _back.Texture.create_as_target(_renderer, _tex_size, blend=_back.BlendMode.BLENDMODE_BLEND)
+        self.size = size
+        with _renderer.target(self.texture):
+            _renderer.clear((0, 0, 0, 0))
+            element.render((0, 0), size)
+
+    def uncache(self):
+        if self.texture:
+            self.texture = None
+            self.policy._release(self)
+
+    def reset(self):
+        self.uncache()
+        self.frames = 0
+
 class Grid(ElementABC):
-    _sub: List[Subelement]
+    _sub: _ZOrder
+    _sub_of_element: Dict[ElementABC, List[Subelement]]
     _mouse_target: Optional[Subelement]
     _mouse_enter: Optional[Subelement]
     _mouse_press: Optional[Subelement]
@@ -47,7 +347,13 @@ class Grid(ElementABC):
 
     def __init__(self, size):
         super().__init__()
-        self._sub = list()
+        self._sub = _ZOrder()
+        self._sub_of_element = dict()
+        self._index = _SpatialIndex()
+        self._cache_policy = None
+        self._render_states = dict()
+        # whether the last render was at a size other than this grid's, damage rects do not match what was drawn then
+        self._render_scaled = False
         self._loc = (0, 0)
         self._sz = size
         self._mouse_target = None
@@ -64,6 +370,7 @@ class Grid(ElementABC):
             'on_this_dragged': self._on_child_this_dragged,
             'on_this_request_top': self._on_child_this_request_top,
             'on_this_request_bottom': self._on_child_this_request_bottom,
+            'on_invalidate': self._on_child_invalidate,
         }
 
     @event_handler
@@ -251,20 +558,53 @@ class Grid(ElementABC):
         else:
             _req_loc = (x, y)
         if after:
-            _found = False
+            if isinstance(after, Subelement):
+                _below = after._z if after._grid is self else None
+            else:
+                _below = max((sub._z for sub in self._sub_of_element.get(after, ())), default=None)
+            if _below is None:
+                return
         else:
-            _found = True
-        for sub in reversed(self._sub):
-            if _found:
-                _sub_loc = (_req_loc[0] - sub.offset[0], _req_loc[1] - sub.offset[1])
-                if 0 <= _sub_loc[0] and 0 <= _sub_loc[1]:
-                    _sz = sub.element.size
-                    if _sub_loc[0] <= _sz[0] and _sub_loc[1] <= _sz[1]:
-                        yield sub, _sub_loc
+            _below = None
+        for sub in sorted(self._index.candidates(*_req_loc), key=_z_key, reverse=True):
+            if _below is not None and sub._z >= _below:
                 continue
-            
-            if sub is after or sub.element is after:
-                _found = True
+            _sub_loc = (_req_loc[0] - sub.offset[0], _req_loc[1] - sub.offset[1])
+            if 0 <= _sub_loc[0] and 0 <= _sub_loc[1]:
+                _sz = sub.element.size
+                if _sub_loc[0] <= _sz[0] and _sub_loc[1] <= _sz[1]:
+                    yield sub, _sub_loc
+
+    def _sub_of(self, element: ElementABC) -> Optional[Subelement]:
+        subs = self._sub_of_element.get(element)
+        if not subs:
+            return None
+        return subs[0] if len(subs) == 1 else min(subs, key=_z_key)
+
+    def _attach_sub(self, sub: Subelement):
+        sub._grid = self
+        self._sub_of_element.setdefault(sub.element, list()).append(sub)
+        self._index.add(sub)
+
+    def _detach_sub(self, sub: Subelement):
+        state = self._render_states.pop(sub, None)
+        if state:
+            state.uncache()
+        sub._grid = None
+        subs = self._sub_of_element[sub.element]
+        subs.remove(sub)
+        if not subs:
+            del self._sub_of_element[sub.element]
+        self._index.remove(sub)
+
+    def _replace_element(self, sub: Subelement, element: ElementABC):
+        self._invalidate_sub(sub)
+        self._detach_sub(sub)
+        self._remove_listeners(sub.element)
+        sub.element = element
+        self._add_listeners(element)
+        self._attach_sub(sub)
+        self._invalidate_sub(sub)
 
     async def _dispatch_sub(self, sub: Optional[Subelement], event, x, y, *args, **kwargs):
         if sub:
@@ -281,13 +621,15 @@ class Grid(ElementABC):
         return None
 
     def _on_child_position_changed(self, dx, dy, child):
-        match = next(sub for sub in self._sub if sub.element is child)
+        match = self._sub_of(child)
+        if not match:
+            return False
         n_off = match.offset
         match.offset = (n_off[0] + dx, n_off[1] + dy)
         return True
 
     async def _on_child_this_dropped(self, this):
-        match = next((sub for sub in self._sub if sub.element is this), None)
+        match = self._sub_of(this)
         if match:
             n_off = match.offset
             sz = this.size
@@ -317,7 +659,7 @@ class Grid(ElementABC):
         return True
 
     async def _on_child_this_dragged(self, this):
-        match = next((sub for sub in self._sub if sub.element is this), None)
+        match = self._sub_of(this)
         if match:
             n_off = match.offset
             sz = this.size
@@ -338,6 +680,27 @@ class Grid(ElementABC):
 
         return True
 
+    def _on_child_invalidate(self, child, rect=None):
+        for match in self._sub_of_element.get(child, ()):
+            state = self._render_states.get(match)
+            if state:
+                state.reset()
+            # child may have been resized
+            self._index.update(match)
+            self._invalidate_sub(match, rect)
+        return True
+
+    def _invalidate_sub(self, sub: Subelement, rect=None):
+        """
+        invalidate region of this grid covered by `sub` (or by `rect` relative to `sub`)
+        """
+        if self._render_scaled:
+            self.invalidate()
+            return
+        if rect is None:
+            rect = (0, 0, *sub.element.size)
+        self.invalidate((sub.offset[0] - self._loc[0] + rect[0], sub.offset[1] - self._loc[1] + rect[1], rect[2], rect[3]))
+
     def _on_child_this_request_top(self, this, all=False):
         self.move_child_top(this)
         if all:
@@ -349,8 +712,9 @@ class Grid(ElementABC):
             self.dispatch('on_this_request_bottom', self, all)
 
     def _add_listeners(self, child: ElementABC):
+        # weak so that children do not keep a dropped grid (and its subtree) alive
         for e, h in self._listener_dict.items():
-            child.event[e].add_listener(h)
+            child.event[e].add_listener(h, weak=True)
 
     def _remove_listeners(self, child: ElementABC):
         for e, h in self._listener_dict.items():
@@ -365,6 +729,8 @@ class Grid(ElementABC):
         self._add_listeners(child)
         handle = Subelement(child, position)
         self._sub.insert(index, handle)
+        self._attach_sub(handle)
+        self._invalidate_sub(handle)
         return handle
 
     def add_child_top(self, child: ElementABC, position):
@@ -376,63 +742,83 @@ class Grid(ElementABC):
         self._add_listeners(child)
         handle = Subelement(child, position)
         self._sub.append(handle)
+        self._attach_sub(handle)
+        self._invalidate_sub(handle)
         return handle
 
     def pop_child_top_sub(self) -> Subelement:
-        sub = self._sub.pop()
+        if not self._sub:
+            raise IndexError('pop from empty grid')
+        sub = self._sub.top()
+        self._sub.remove(sub)
+        self._detach_sub(sub)
         self._remove_listeners(sub.element)
+        self._invalidate_sub(sub)
         return sub
 
     def pop_child_top(self) -> ElementABC:
         return self.pop_child_top_sub().element
 
     def pop_child_if_sub(self, predicate: Callable[[ElementABC], bool]) -> List[Subelement]:
-        _idx = {i for i, sub in enumerate(self._sub) if predicate(sub.element)}
-        childs = [sub for i, sub in enumerate(self._sub) if i in _idx]
-        self._sub = [sub for i, sub in enumerate(self._sub) if i not in _idx]
+        childs = [sub for sub in self._sub if predicate(sub.element)]
         for child in childs:
+            self._sub.remove(child)
+            self._detach_sub(child)
             self._remove_listeners(child.element)
+            self._invalidate_sub(child)
         return childs
 
     def pop_child_if(self, predicate: Callable[[ElementABC], bool]) -> List[ElementABC]:
         return (sub.element for sub in self.pop_child_if_sub(predicate))
 
     def remove_child(self, child: Union[int, ElementABC, Subelement]):
-        if isinstance(child, Subelement):
-            self._sub.remove(child)
-        elif isinstance(child, int):
-            child = self._sub.pop(child)
-        else:
+        if isinstance(child, int):
+            child = self._sub.at(child)
+        elif not isinstance(child, Subelement):
             assert isinstance(child, ElementABC), 'unrecognized grid.remove_child child argument type'
-            self.pop_child_if(lambda c: c is child)
+            for sub in list(self._sub_of_element.get(child, ())):
+                self._sub.remove(sub)
+                self._detach_sub(sub)
+                self._remove_listeners(sub.element)
+                self._invalidate_sub(sub)
             return
+        elif child._grid is not self:
+            raise ValueError('subelement is not in grid')
         
+        self._sub.remove(child)
+        self._detach_sub(child)
         self._remove_listeners(child.element)
+        self._invalidate_sub(child)
 
     def clear(self):
+        self._clear_render_states()
+        for sub in self._sub:
+            sub._grid = None
         self._sub.clear()
+        self._sub_of_element.clear()
+        self._index.clear()
+        self.invalidate()
 
-    def move_child_top(self, child: Union[int, ElementABC, Subelement]):
-        if isinstance(child, Subelement):
-            child = self._sub.index(child)
-
+    def _subs_to_move(self, child: Union[int, ElementABC, Subelement]) -> List[Subelement]:
         if isinstance(child, int):
-            self._sub.append(self._sub.pop(child))
+            return [self._sub.at(child)]
+        elif isinstance(child, Subelement):
+            if child._grid is not self:
+                raise ValueError('subelement is not in grid')
+            return [child]
         else:
             assert isinstance(child, ElementABC), 'unrecognized grid.move_child_top child argument type'
-            _idx = {i for i, sub in enumerate(self._sub) if sub.element is child}
-            self._sub = [*(sub for i, sub in enumerate(self._sub) if i not in _idx), *(sub for i, sub in enumerate(self._sub) if i in _idx)]
+            return sorted(self._sub_of_element.get(child, ()), key=_z_key)
 
-    def move_child_bottom(self, child: Union[int, ElementABC, Subelement]):
-        if isinstance(child, Subelement):
-            child = self._sub.index(child)
+    def move_child_top(self, child: Union[int, ElementABC, Subelement]):
+        for sub in self._subs_to_move(child):
+            self._sub.move_top(sub)
+            self._invalidate_sub(sub)
 
-        if isinstance(child, int):
-            self._sub.insert(0, self._sub.pop(child))
-        else:
-            assert isinstance(child, ElementABC), 'unrecognized grid.move_child_top child argument type'
-            _idx = {i for i, sub in enumerate(self._sub) if sub.element is child}
-            self._sub = [*(sub for i, sub in enumerate(self._sub) if i in _idx), *(sub for i, sub in enumerate(self._sub) if i not in _idx)]
+    def move_child_bottom(self, child: Union[int, ElementABC, Subelement]):
+        for sub in reversed(self._subs_to_move(child)):
+            self._sub.move_bottom(sub)
+            self._invalidate_sub(sub)
 
     def _bound(self):
         all_loc = [Rect(pos, c.size) for c, pos in self._sub]
@@ -450,6 +836,7 @@ class Grid(ElementABC):
     @size.setter
     def size(self, size):
         self._sz = size
+        self.invalidate()
 
     @property
     def view(self):
@@ -462,18 +849,76 @@ class Grid(ElementABC):
         self._loc = new_view[0]
         if new_view[1]:
             self._sz = (new_view[1][0] - new_view[0][0], new_view[1][1] - new_view[0][1])
+        self.invalidate()
+
+    @property
+    def render_cache_policy(self) -> Optional[RenderCachePolicy]:
+        """
+        policy deciding which children have their render result cached, None to not cache
+        """
+        return self._cache_policy
+
+    @render_cache_policy.setter
+    def render_cache_policy(self, policy: Optional[RenderCachePolicy]):
+        self._clear_render_states()
+        self._cache_policy = policy
+
+    def _clear_render_states(self):
+        for state in self._render_states.values():
+            state.uncache()
+        self._render_states.clear()
+
+    def _note_render_size(self, size):
+        self._render_scaled = bool(size) and (round(size[0]), round(size[1])) != (round(self._sz[0]), round(self._sz[1]))
 
     def render(self, location, size=None):
-        for c, pos in self._sub:
-            _sz = c.size
-            x, y = pos
-            if 0 <= x - self._loc[0] and x - self._loc[0] <= self._sz[0] and 0 <= y - self._loc[1] and y - self._loc[1] <= self._sz[1]:
-                if size:
-                    factorx = size[0] / self._sz[0]
-                    factory = size[1] / self._sz[1]
-                    c.render((location[0] + (x - self._loc[0])*factorx, location[1] + (y - self._loc[1])*factory), (_sz[0]*factorx, _sz[1]*factory))
-                else:
-                    c.render((location[0] + (x - self._loc[0]), location[1] + (y - self._loc[1])))
+        self._note_render_size(size)
+        self._render_area(location, size, self._loc, self._sz)
+
+    def _render_area(self, location, size, loc, sz):
+        """
+        render area of this grid at `loc` of size `sz` to `location` (scaled to `size`)
+        """
+        _renderer = _current_backend().current_renderer()
+        _prev_clip = _renderer.clip_rect
+        clip = _intersect_rect((*location, *(size if size else sz)), _prev_clip)
+        if not clip:
+            return
+
+        if size:
+            factorx = size[0] / sz[0]
+            factory = size[1] / sz[1]
+        else:
+            factorx = factory = 1
+
+        # visible area in grid coordinate
+        vx0 = loc[0] + (clip[0] - location[0]) / factorx
+        vy0 = loc[1] + (clip[1] - location[1]) / factory
+        vx1 = vx0 + clip[2] / factorx
+        vy1 = vy0 + clip[3] / factory
+        subs = self._index.query(vx0, vy0, vx1, vy1)
+        subs = self._sub if subs is None else sorted(subs, key=_z_key)
+
+        policy = self._cache_policy
+        _renderer.clip_rect = clip
+        try:
+            for sub in subs:
+                c, (x, y) = sub.element, sub.offset
+                _sz = c.size
+                if x < vx1 and vx0 < x + _sz[0] and y < vy1 and vy0 < y + _sz[1]:
+                    if size:
+                        args = ((location[0] + (x - loc[0])*factorx, location[1] + (y - loc[1])*factory), (_sz[0]*factorx, _sz[1]*factory))
+                    else:
+                        args = ((location[0] + (x - loc[0]), location[1] + (y - loc[1])),)
+                    if policy:
+                        state = self._render_states.get(sub)
+                        if not state:
+                            state = self._render_states[sub] = _ChildRenderState(policy)
+                        state.render(c, *args)
+                    else:
+                        c.render(*args)
+        finally:
+            _renderer.clip_rect = _prev_clip
 
 
 class StaticGridError(Exception):
@@ -550,6 +995,45 @@ class StaticGrid(Grid):
     def render(self, location, size=None):
         self.texture().draw(location, size=size)
 
+class CachedGrid(Grid):
+    def __init__(self, size, *, max_cached_sizes=4):
+        """
+        Grid that renders its children to a texture and reuses it until the grid is invalidated
+
+        parameters:
+            [max_cached_sizes]
+                number of render sizes that have their own cached texture (least recently used is dropped)
+        """
+        super().__init__(size)
+        self._max_cached_sizes = max_cached_sizes
+        self._textures = OrderedDict()
+
+    def invalidate(self, rect=None):
+        self._textures.clear()
+        super().invalidate(rect)
+
+    def texture(self, size=None):
+        _size = (round(size[0]), round(size[1])) if size else (round(self._sz[0]), round(self._sz[1]))
+        _tex = self._textures.get(_size)
+        if _tex:
+            self._textures.move_to_end(_size)
+            return _tex
+
+        _back = _current_backend()
+        _renderer = _back.current_renderer()
+        _tex = _back.Texture.create_as_target(_renderer, _size, blend=_back.BlendMode.BLENDMODE_BLEND)
+        with _renderer.target(_tex):
+            _renderer.clear((0, 0, 0, 0))
+            super().render((0, 0), size=_size)
+
+        self._textures[_size] = _tex
+        while len(self._textures) > self._max_cached_sizes:
+            self._textures.popitem(last=False)
+        return _tex
+
+    def render(self, location, size=None):
+        self.texture(size).draw(location)
+
 class AlignMode(Enum):
     LEFT = auto()
     CENTER = auto()
@@ -643,3 +1127,8 @@ class StructuredGrid(StructuredMixin, Grid):
 class StructuredStaticGrid(StructuredMixin, StaticGrid):
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
+
+
+class StructuredCachedGrid(StructuredMixin, CachedGrid):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
@@ -67,6 +67,7 @@ class DragableMixin(ElementABC):
         if self._pos != value:
             dx, dy = value[0] - self._pos[0], value[1] - self._pos[1]
             self.dispatch('on_position_changed', dx, dy, self)
+            self.invalidate()
 
     @property
     def start_pos(self):
@@ -13,16 +13,25 @@ class _Bar(DragableMixin, Button):
 
 
 class HorizontalScrollbar(Grid):
+    MIN_BAR_LENGTH = 8
+
     def __init__(self, size, content_width, **kwargs):
         self._content_width = content_width
         super().__init__(size)
-        self._bar = _Bar((self._bar_length(), self.size[1]), self._bar_movement_calc, **kwargs)
+        self._bar_kwargs = kwargs
+        self._bar = None
+        self._make_bar()
+
+    def _make_bar(self):
+        if self._bar:
+            self.remove_child(self._bar)
+        self._bar = _Bar((self._bar_length(), self.size[1]), self._bar_movement_calc, **self._bar_kwargs)
         self.add_child_top(self._bar, (0, 0))
         self._bar.event['on_this_dragged'].add_listener(lambda this: self.dispatch('on_scroll', self.represented_section))
 
     def _bar_length(self):
         _size_x = self.size[0]
-        return min((_size_x*_size_x)/self._content_width, _size_x)
+        return min(max((_size_x*_size_x)/self._content_width, self.MIN_BAR_LENGTH), _size_x)
 
     def _bar_movement_calc(self, mousex, mousey, dx, dy):
         _size_x = self.size[0]
@@ -39,27 +48,51 @@ class HorizontalScrollbar(Grid):
 
     @content_width.setter
     def content_width(self, w):
+        start = self.represented_section[0]
         self._content_width = w
-        self._bar.size = (self._bar_length(), self.size[1])
+        # bar is not resizable, replace it and keep the represented section where possible
+        self._make_bar()
+        self.scroll_to(start)
+
+    def scroll_to(self, start):
+        """
+        move the bar so that represented section starts at `start` of the content (clamped)
+        """
+        _size_x = self.size[0]
+        _travel_x = _size_x - self._bar_length()
+        _content_travel_x = self._content_width - _size_x
+        self._bar.pos = self._bar_movement_calc((start * _travel_x)/_content_travel_x if _content_travel_x > 0 else 0, 0, 0, 0)
+        self.dispatch('on_scroll', self.represented_section)
 
     @property
     def represented_section(self):
         _size_x = self.size[0]
-        bar_left = self._bar.pos[0]
-        return ((bar_left * self._content_width)/_size_x, ((bar_left + self._bar_length()) * self._content_width)/_size_x)
+        _travel_x = _size_x - self._bar_length()
+        # bar may be longer than proportional, map its travel onto the content travel
+        start = (self._bar.pos[0] * (self._content_width - _size_x))/_travel_x if _travel_x > 0 else 0
+        return (start, start + _size_x)
 
 
 class VerticalScrollbar(Grid):
+    MIN_BAR_LENGTH = 8
+
     def __init__(self, size, content_height, **kwargs):
         self._content_height = content_height
         super().__init__(size)
-        self._bar = _Bar((self.size[0], self._bar_height()), self._bar_movement_calc, **kwargs)
+        self._bar_kwargs = kwargs
+        self._bar = None
+        self._make_bar()
+
+    def _make_bar(self):
+        if self._bar:
+            self.remove_child(self._bar)
+        self._bar = _Bar((self.size[0], self._bar_height()), self._bar_movement_calc, **self._bar_kwargs)
         self.add_child_top(self._bar, (0, 0))
         self._bar.event['on_this_dragged'].add_listener(lambda this: self.dispatch('on_scroll', self.represented_section))
 
     def _bar_height(self):
         _size_y = self.size[1]
-        return min((_size_y*_size_y)/self._content_height, _size_y)
+        return min(max((_size_y*_size_y)/self._content_height, self.MIN_BAR_LENGTH), _size_y)
 
     def _bar_movement_calc(self, mousex, mousey, dx, dy):
         _size_y = self.size[1]
@@ -76,11 +109,26 @@ class VerticalScrollbar(Grid):
 
     @content_height.setter
     def content_height(self, h):
+        start = self.represented_section[0]
         self._content_height = h
-        self._bar.size = (self.size[0], self._bar_height())
+        # bar is not resizable, replace it and keep the represented section where possible
+        self._make_bar()
+        self.scroll_to(start)
+
+    def scroll_to(self, start):
+        """
+        move the bar so that represented section starts at `start` of the content (clamped)
+        """
+        _size_y = self.size[1]
+        _travel_y = _size_y - self._bar_height()
+        _content_travel_y = self._content_height - _size_y
+        self._bar.pos = self._bar_movement_calc(0, (start * _travel_y)/_content_travel_y if _content_travel_y > 0 else 0, 0, 0)
+        self.dispatch('on_scroll', self.represented_section)
 
     @property
     def represented_section(self):
         _size_y = self.size[1]
-        bar_left = self._bar.pos[1]
-        return ((bar_left * self._content_height)/_size_y, ((bar_left + self._bar_height()) * self._content_height)/_size_y)
+        _travel_y = _size_y - self._bar_height()
+        # bar may be longer than proportional, map its travel onto the content travel
+        start = (self._bar.pos[1] * (self._content_height - _size_y))/_travel_y if _travel_y > 0 else 0
+        return (start, start + _size_y)
@@ -0,0 +1,135 @@
+from collections import OrderedDict
+import math
+from typing import Union
+
+from ...core.backend_loader import _current_backend
+from .grid import Grid, Subelement, _intersect_rect
+from .scrollbar import HorizontalScrollbar, VerticalScrollbar
+
+from ...utils.typehint import *
+
+class ScrollView(Grid):
+    _tiles: 'OrderedDict[Tuple[int, int], Any]'
+
+    def __init__(self, size, *, tile_size=256, max_tiles=None):
+        """
+        Grid that caches its content in tiles of `tile_size`, changing the view only draws
+        already rendered tiles at new offsets and renders tiles that were not visible before.
+        Tiles are re-rendered only when children in them changed.
+
+        parameters:
+            [tile_size]
+                width and height of a tile
+            [max_tiles]
+                number of tiles kept, enough to cover the view twice if unspecified
+        """
+        super().__init__(size)
+        self._tile_size = tile_size
+        self._max_tiles = max_tiles
+        self._tiles = OrderedDict()
+
+    @property
+    def offset(self):
+        """
+        location of the view in the content
+        """
+        return self._loc
+
+    @offset.setter
+    def offset(self, offset):
+        self.view = (offset, None)
+
+    def bind_scrollbar(self, scrollbar: Union[HorizontalScrollbar, VerticalScrollbar]):
+        """
+        scroll this view when `scrollbar` is scrolled
+        """
+        if isinstance(scrollbar, HorizontalScrollbar):
+            scrollbar.event['on_scroll'].add_listener(self._on_horizontal_scroll, weak=True)
+        else:
+            assert isinstance(scrollbar, VerticalScrollbar), 'unrecognized scrollview.bind_scrollbar scrollbar argument type'
+            scrollbar.event['on_scroll'].add_listener(self._on_vertical_scroll, weak=True)
+
+    def _on_horizontal_scroll(self, section):
+        self.offset = (section[0], self._loc[1])
+
+    def _on_vertical_scroll(self, section):
+        self.offset = (self._loc[0], section[0])
+
+    def _invalidate_sub(self, sub: Subelement, rect=None):
+        if rect is None:
+            rect = (0, 0, *sub.element.size)
+        self._drop_tiles((sub.offset[0] + rect[0], sub.offset[1] + rect[1], rect[2], rect[3]))
+        super()._invalidate_sub(sub, rect)
+
+    def _drop_tiles(self, rect):
+        """
+        drop tiles intersecting `rect` (x, y, w, h) in grid coordinate
+        """
+        _t = self._tile_size
+        tx0, ty0 = math.floor(rect[0] / _t), math.floor(rect[1] / _t)
+        tx1, ty1 = math.floor((rect[0] + rect[2]) / _t), math.floor((rect[1] + rect[3]) / _t)
+        if (tx1 - tx0 + 1) * (ty1 - ty0 + 1) > len(self._tiles):
+            for key in [key for key in self._tiles if tx0 <= key[0] <= tx1 and ty0 <= key[1] <= ty1]:
+                del self._tiles[key]
+        else:
+            for tx in range(tx0, tx1 + 1):
+                for ty in range(ty0, ty1 + 1):
+                    self._tiles.pop((tx, ty), None)
+
+    def clear(self):
+        super().clear()
+        self._tiles.clear()
+
+    def _tile(self, tx, ty):
+        tile = self._tiles.get((tx, ty))
+        if tile:
+            self._tiles.move_to_end((tx, ty))
+            return tile
+
+        _t = self._tile_size
+        _back = _current_backend()
+        _renderer = _back.current_renderer()
+        tile = _back.Texture.create_as_target(_renderer, (_t, _t), blend=_back.BlendMode.BLENDMODE_BLEND)
+        with _renderer.target(tile):
+            _renderer.clear((0, 0, 0, 0))
+            self._render_area((0, 0), None, (tx * _t, ty * _t), (_t, _t))
+        self._tiles[(tx, ty)] = tile
+        return tile
+
+    def render(self, location, size=None):
+        self._note_render_size(size)
+        _renderer = _current_backend().current_renderer()
+        _prev_clip = _renderer.clip_rect
+        clip = _intersect_rect((*location, *(size if size else self._sz)), _prev_clip)
+        if not clip:
+            return
+
+        if size:
+            factorx = size[0] / self._sz[0]
+            factory = size[1] / self._sz[1]
+        else:
+            factorx = factory = 1
+
+        _t = self._tile_size
+        # visible tiles
+        tx0 = math.floor((self._loc[0] + (clip[0] - location[0]) / factorx) / _t)
+        ty0 = math.floor((self._loc[1] + (clip[1] - location[1]) / factory) / _t)
+        tx1 = math.ceil((self._loc[0] + (clip[0] + clip[2] - location[0]) / factorx) / _t)
+        ty1 = math.ceil((self._loc[1] + (clip[1] + clip[3] - location[1]) / factory) / _t)
+
+        _renderer.clip_rect = clip
+        try:
+            for ty in range(ty0, ty1):
+                y0 = round(location[1] + (ty * _t - self._loc[1]) * factory)
+                y1 = round(location[1] + ((ty + 1) * _t - self._loc[1]) * factory)
+                for tx in range(tx0, tx1):
+                    x0 = round(location[0] + (tx * _t - self._loc[0]) * factorx)
+                    x1 = round(location[0] + ((tx + 1) * _t - self._loc[0]) * factorx)
+                    self._tile(tx, ty).blit_to_target(dst_rect_or_coord=(x0, y0, x1 - x0, y1 - y0))
+        finally:
+            _renderer.clip_rect = _prev_clip
+
+        max_tiles = self._max_tiles if self._max_tiles else 2 * (math.ceil(self._sz[0] / _t) + 1) * (math.ceil(self._sz[1] / _t) + 1)
+        max_tiles = max(max_tiles, (tx1 - tx0) * (ty1 - ty0))
+        while len(self._tiles) > max_tiles:
+            self._tiles.popitem(last=False)
@@ -0,0 +1,119 @@
+import math
+from typing import Optional
+
+from ...core.elementABC import ElementABC
+from ...core.eventdispatch import event_handler
+from .grid import Grid, Subelement
+from .scrollbar import VerticalScrollbar
+
+from ...utils.typehint import *
+
+class VirtualList(Grid):
+    _rows: Dict[int, Subelement]
+    _pool: List[ElementABC]
+
+    def __init__(self, size, row_count, row_height, row_factory: Callable[[int, Optional[ElementABC]], ElementABC], *, overscan=2, scrollbar_width=16, scroll_step=None, **kwargs):
+        """
+        Vertical list of `row_count` rows that only has elements for rows that are visible
+
+        parameters:
+            row_factory
+                called as row_factory(index, element) to get element of row `index`, `element` is
+                a recycled row element that may be updated and returned, or None
+            [overscan]
+                number of rows materialized above and below the visible rows
+            [scroll_step]
+                content offset scrolled per mouse wheel step, one row if unspecified
+            other keyword arguments are passed to the scrollbar
+        """
+        super().__init__(size)
+        self._row_count = row_count
+        self._row_height = row_height
+        self._row_factory = row_factory
+        self._overscan = overscan
+        self._scroll_step = scroll_step if scroll_step else row_height
+        self._top = 0
+        self._rows = dict()
+        self._pool = list()
+        self._content = Grid((size[0] - scrollbar_width, size[1]))
+        self._scrollbar = VerticalScrollbar((scrollbar_width, size[1]), self._content_height(), **kwargs)
+        self._scrollbar.event['on_scroll'].add_listener(self._on_scroll)
+        self.add_child_top(self._content, (0, 0))
+        self._scrollbar_sub = self.add_child_top(self._scrollbar, (size[0] - scrollbar_width, 0))
+        self._update_rows()
+
+    def _content_height(self):
+        # scrollbar cannot represent content shorter than itself
+        return max(self._row_count * self._row_height, self.size[1])
+
+    def _on_scroll(self, section):
+        self._set_top(section[0])
+
+    def _set_top(self, top):
+        top = min(max(top, 0), self._content_height() - self.size[1])
+        if top != self._top:
+            self._top = top
+            self._content.view = ((0, top), None)
+            self._update_rows()
+
+    def _visible_range(self):
+        first = max(math.floor(self._top / self._row_height) - self._overscan, 0)
+        last = min(math.ceil((self._top + self.size[1]) / self._row_height) + self._overscan, self._row_count)
+        return range(first, last)
+
+    def _update_rows(self, refresh=False):
+        visible = self._visible_range()
+        for i in [i for i in self._rows if refresh or i not in visible]:
+            sub = self._rows.pop(i)
+            self._content.remove_child(sub)
+            self._pool.append(sub.element)
+        for i in visible:
+            if i not in self._rows:
+                element = self._row_factory(i, self._pool.pop() if self._pool else None)
+                self._rows[i] = self._content.add_child_top(element, (0, i * self._row_height))
+        # rows not needed anymore are not kept beyond what may be reused on the next scroll
+        del self._pool[len(visible):]
+
+    @property
+    def row_count(self):
+        return self._row_count
+
+    @row_count.setter
+    def row_count(self, count):
+        self._row_count = count
+        self._scrollbar.content_height = self._content_height()
+        self._set_top(self._top)
+        self._update_rows(refresh=True)
+
+    @property
+    def top(self):
+        """
+        content offset of the top of the list
+        """
+        return self._top
+
+    def scroll_to(self, top):
+        self._scrollbar.scroll_to(top)
+
+    def scroll_to_row(self, index):
+        self.scroll_to(index * self._row_height)
+
+    def refresh(self):
+        """
+        re-materialize visible rows, call after content of rows changed
+        """
+        self._update_rows(refresh=True)
+
+    @event_handler
+    async def on_mouse_scroll(self, x, y, dx, dy): # pylint: disable=unused-variable
+        # only the scrollbar may take scroll events, rows without a scroll handler would otherwise report them as handled
+        self._mouse_pos = (x, y)
+        target = self._mouse_press
+        if not target:
+            target = next((sub for sub, _ in self.elements_at(x, y, actual_loc=True)), None)
+        if target is self._scrollbar_sub and await super().dispatch_async('on_mouse_scroll', x, y, dx, dy):
+            return True
+        if dy:
+            self.scroll_to(self._top - dy * self._scroll_step)
+            return True
+        return False
@@ -1,8 +1,14 @@
 from abc import abstractmethod
+from collections import OrderedDict
 
 from ..core.elementABC import ElementABC
 
 class FilterABC(ElementABC):
+    # number of render sizes a static filter keeps a texture for (least recently used is dropped)
+    MAX_CACHED_SIZES = 4
+    # whether this filter only resizes (`target_size`) and modulates (`modulation`) its target, see `FusableFilterABC`
+    fusable = False
+
     def __init__(self, target: ElementABC, *args, size=None):
         super().__init__()
         self._target = target
@@ -12,25 +18,101 @@ class FilterABC(ElementABC):
         self._static = target.static
 
         self.args = args
-        
-        if target.static:
-            self._tex = self.texture(size)
-        else:
-            self._tex = None
+
+        # render size -> texture drawn for it, only for static filters
+        self._textures = OrderedDict()
         self.target = self._target
+        self._target.event['on_invalidate'].add_listener(self._on_target_invalidate, weak=True)
+
+    def _on_target_invalidate(self, element, rect=None):
+        self._drop_textures()
+        self.invalidate()
+        return True
 
     @property
     def size(self):
         return self._sz if self._sz else self._target.size
 
+    def target_size(self, size):
+        """
+        size the target is rendered at when this filter is rendered at `size`
+        """
+        return size
+
+    def modulation(self):
+        """
+        color (r, g, b, a) this filter modulates its target with, None if it does not
+        """
+        return None
+
+    def _fuse(self, size):
+        """
+        innermost target of the chain of fusable filters starting at this filter, size its texture is needed at
+        and combined modulation of the chain (None if nothing in the chain modulates)
+        """
+        target, color = self, None
+        while isinstance(target, FilterABC) and target.fusable:
+            size = target.target_size(size)
+            _color = target.modulation()
+            if _color:
+                color = tuple(a * b // 255 for a, b in zip(color, _color)) if color else _color
+            target = target._target
+        return target, size, color
+
     @abstractmethod
-    def texture(self):
+    def texture(self, size=None):
         raise NotImplementedError()
 
+    def _cached_texture(self, target: ElementABC, size):
+        key = (round(size[0]), round(size[1])) if size else None
+        texture = self._textures.get(key)
+        if texture:
+            self._textures.move_to_end(key)
+            return texture
+        texture = target.texture(size)
+        if texture:
+            self._textures[key] = texture
+            while len(self._textures) > self.MAX_CACHED_SIZES:
+                self._textures.popitem(last=False)[1].release()
+        return texture
+
+    def _drop_textures(self):
+        for texture in self._textures.values():
+            texture.release()
+        self._textures.clear()
+
     def render(self, location, size=None):
-        if self._tex and not size:
-            self._tex.draw(location)
+        size = size if size else self._sz
+        if self.fusable:
+            target, size, color = self._fuse(size)
         else:
-            texture = self.texture(size if size else self._sz)
+            target, color = self, None
+
+        if self._static:
+            texture = self._cached_texture(target, size)
             if texture:
-                texture.draw(location)
+                texture.draw(location, color=color)
+            return
+
+        texture = target.texture(size)
+        if texture:
+            with texture:
+                texture.draw(location, color=color)
+
+
+class FusableFilterABC(FilterABC):
+    """
+    filter that only resizes (`target_size`) and modulates (`modulation`) its target
+
+    a chain of fusable filters is drawn as a single texture of the innermost target instead of a texture
+    for each filter
+    """
+    fusable = True
+
+    def texture(self, size=None):
+        target, size, color = self._fuse(size)
+        texture = target.texture(size)
+        if not texture or not color:
+            return texture
+        with texture:
+            return texture.as_color_mod(color, pooled=True)
@@ -1,7 +1,7 @@
-from .filterABC import FilterABC
+from .filterABC import FusableFilterABC
 from ..core.backend_loader import _current_backend
 
-class Brightness(FilterABC):
+class Brightness(FusableFilterABC):
     """
     Show element at lower brightness
     
@@ -11,12 +11,11 @@ class Brightness(FilterABC):
         args[0]
             brightness (0.0-1.0)
     """
-    def texture(self, size=None):
-        orig_tex = self._target.texture(size)
-        return orig_tex.as_color_mod((int(255*self.args[0]), int(255*self.args[0]), int(255*self.args[0]), 255))
+    def modulation(self):
+        return (int(255*self.args[0]), int(255*self.args[0]), int(255*self.args[0]), 255)
 
 
-class Opacity(FilterABC):
+class Opacity(FusableFilterABC):
     """
     Show element at lower opacity
     
@@ -26,12 +25,11 @@ class Opacity(FilterABC):
         args[0]
             opacity (0.0-1.0)
     """
-    def texture(self, size=None):
-        orig_tex = self._target.texture(size)
-        return orig_tex.as_color_mod((255, 255, 255, int(255*self.args[0])))
+    def modulation(self):
+        return (255, 255, 255, int(255*self.args[0]))
 
 
-class Scale(FilterABC):
+class Scale(FusableFilterABC):
     """
     Scale element
     
@@ -41,5 +39,5 @@ class Scale(FilterABC):
         args[0]
             size
     """
-    def texture(self, size=None):
-        return self._target.texture(size if size else self._sz)
+    def target_size(self, size):
+        return size if size else self._sz
@@ -12,12 +12,12 @@ class Image(ElementABC):
     @staticmethod
     def from_file(filename):
         _back = _current_backend()
-        return Image(_back.Texture.from_file(_back.current_renderer(), filename))
+        return Image(_back.atlas_of(_back.current_renderer()).texture_from_surface(_back.Surface.from_file(filename)))
 
     @staticmethod
     def from_io(io, ext_hint):
         _back = _current_backend()
-        return Image(_back.Texture.from_file(_back.current_renderer(), io, ext_hint))
+        return Image(_back.atlas_of(_back.current_renderer()).texture_from_surface(_back.Surface.from_io(io, ext_hint)))
 
     @staticmethod
     def from_texture(texture):
@@ -32,4 +32,4 @@ class Image(ElementABC):
 
     def texture(self, size=None):
         # TODO: prevent making a copy of the texture
-        return self._tex if not size else self._tex.as_size(size)
+        return self._tex if not size else self._tex.as_size(size, pooled=True)
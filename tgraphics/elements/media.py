@@ -5,6 +5,7 @@ class Player(ElementABC):
     def __init__(self):
         super().__init__()
         self._player = _current_backend().media.Player()
+        self._player.event['on_new_frame'].add_listener(self.invalidate, weak=True)
 
     def play(self, window=None):
         window = _current_backend().current_renderer().window if not window else window
@@ -51,7 +52,7 @@ class Player(ElementABC):
         if not texture:
             return None
         elif size:
-            return texture.as_size(size)
+            return texture.as_size(size, pooled=True)
         return texture
 
 # PEP562